@@ -1,11 +1,8 @@
 import streamlit as st
 import pandas as pd
-import altair as alt
-import plotly.express as px
-import plotly.graph_objects as go
-from utils.data_processor import list_uploaded_files, get_dataframe
+from utils.data_processor import list_uploaded_files, get_dataframe, get_column_groups, get_dataframe_head, get_dataset_overview, dataframe_fingerprint
 from utils.nlp_processor import process_natural_language_query
-from utils.visualization import create_visualization, render_visualization, get_visualization_suggestions
+from utils.visualization import create_visualization, cached_render_visualization, get_visualization_suggestions
 
 st.set_page_config(
     page_title="Data Visualization - DataVizSME",
@@ -23,10 +20,22 @@ if 'visualizations' not in st.session_state:
 if 'current_file' not in st.session_state:
     st.session_state.current_file = None
 
+if 'visualization_figures' not in st.session_state:
+    st.session_state.visualization_figures = {}  # {viz_name: (dataset fingerprint, figure)}
+
 # Function to save visualization
-def save_visualization(name, config):
+def save_visualization(name, config, df, fig=None):
     st.session_state.visualizations[name] = config
-    st.success(f"Visualization '{name}' saved successfully!")
+    # Keep the built figure so the Saved tab can show it without rebuilding
+    if fig is None:
+        fig = cached_render_visualization(df, config)
+    st.session_state.visualization_figures[name] = (dataframe_fingerprint(df), fig)
+    # Tabs rerun as isolated fragments, so rerun the page to refresh the Saved tab
+    st.session_state.visualization_message = f"Visualization '{name}' saved successfully!"
+    st.rerun()
+
+if 'visualization_message' in st.session_state:
+    st.success(st.session_state.pop('visualization_message'))
 
 # Check if we have any datasets
 available_files = list_uploaded_files()
@@ -53,15 +62,16 @@ except Exception as e:
 
 # Display dataset info
 with st.expander("Dataset Preview"):
-    st.dataframe(df.head(10))
-    st.write(f"Shape: {df.shape[0]} rows, {df.shape[1]} columns")
-    st.write(f"Columns: {', '.join(df.columns)}")
+    st.dataframe(get_dataframe_head(selected_file))
+    for line in get_dataset_overview(selected_file):
+        st.write(line)
 
 # Tabs for different visualization creation methods
 tab1, tab2, tab3, tab4 = st.tabs(["Natural Language", "Builder", "Saved Visualizations", "Suggestions"])
 
 # Natural Language Tab
-with tab1:
+@st.fragment
+def natural_language_tab(df):
     st.subheader("Create Visualizations Using Natural Language")
     st.write("Describe the visualization you want in plain English")
     
@@ -84,7 +94,7 @@ with tab1:
             st.write("### Generated Visualization")
             
             try:
-                fig = render_visualization(df, viz_config)
+                fig = cached_render_visualization(df, viz_config)
                 st.plotly_chart(fig, use_container_width=True)
                 
                 # Save option
@@ -94,16 +104,20 @@ with tab1:
                         if viz_name in st.session_state.visualizations:
                             overwrite = st.checkbox("A visualization with this name already exists. Overwrite?")
                             if overwrite:
-                                save_visualization(viz_name, viz_config)
+                                save_visualization(viz_name, viz_config, df, fig)
                         else:
-                            save_visualization(viz_name, viz_config)
+                            save_visualization(viz_name, viz_config, df, fig)
             except Exception as e:
                 st.error(f"Error generating visualization: {str(e)}")
         else:
             st.warning("Could not interpret your query. Please try a different description.")
 
+with tab1:
+    natural_language_tab(df)
+
 # Builder Tab
-with tab2:
+@st.fragment
+def builder_tab(df, filename):
     st.subheader("Visualization Builder")
     st.write("Create visualizations by selecting chart type and data fields")
     
@@ -114,10 +128,7 @@ with tab2:
     )
     
     # Get columns of different types
-    numeric_cols = df.select_dtypes(include=['int64', 'float64']).columns.tolist()
-    categorical_cols = df.select_dtypes(include=['object', 'category', 'bool']).columns.tolist()
-    temporal_cols = df.select_dtypes(include=['datetime64']).columns.tolist()
-    all_cols = df.columns.tolist()
+    numeric_cols, categorical_cols, temporal_cols, all_cols = get_column_groups(filename)
     
     # Configuration based on chart type
     viz_config = {"chart_type": chart_type.lower().replace(" ", "_")}
@@ -166,7 +177,7 @@ with tab2:
     # Generate visualization
     if st.button("Generate Visualization"):
         try:
-            fig = render_visualization(df, viz_config)
+            fig = cached_render_visualization(df, viz_config)
             st.plotly_chart(fig, use_container_width=True)
             
             # Save option
@@ -176,15 +187,19 @@ with tab2:
                     if viz_name in st.session_state.visualizations:
                         overwrite = st.checkbox("A visualization with this name already exists. Overwrite?")
                         if overwrite:
-                            save_visualization(viz_name, viz_config)
+                            save_visualization(viz_name, viz_config, df, fig)
                     else:
-                        save_visualization(viz_name, viz_config)
+                        save_visualization(viz_name, viz_config, df, fig)
         except Exception as e:
             st.error(f"Error generating visualization: {str(e)}")
             st.error("Please check your selections and try again.")
 
+with tab2:
+    builder_tab(df, selected_file)
+
 # Saved Visualizations Tab
-with tab3:
+@st.fragment
+def saved_tab(df):
     st.subheader("Saved Visualizations")
     
     if not st.session_state.visualizations:
@@ -196,9 +211,13 @@ with tab3:
         if viz_to_display:
             viz_config = st.session_state.visualizations[viz_to_display]
             
-            # Display visualization
+            # Display visualization, reusing the figure built at save time if the data is unchanged
             try:
-                fig = render_visualization(df, viz_config)
+                saved_figure = st.session_state.visualization_figures.get(viz_to_display)
+                if saved_figure and saved_figure[0] == dataframe_fingerprint(df):
+                    fig = saved_figure[1]
+                else:
+                    fig = cached_render_visualization(df, viz_config)
                 st.plotly_chart(fig, use_container_width=True)
                 
                 # Actions
@@ -212,14 +231,19 @@ with tab3:
                 with col2:
                     if st.button("Delete Visualization"):
                         del st.session_state.visualizations[viz_to_display]
+                        st.session_state.visualization_figures.pop(viz_to_display, None)
                         st.success(f"Visualization '{viz_to_display}' deleted successfully")
                         st.rerun()
             
             except Exception as e:
                 st.error(f"Error displaying visualization: {str(e)}")
 
+with tab3:
+    saved_tab(df)
+
 # Suggestions Tab
-with tab4:
+@st.fragment
+def suggestions_tab(df):
     st.subheader("Visualization Suggestions")
     st.write("Smart suggestions based on your dataset structure")
     
@@ -234,13 +258,17 @@ with tab4:
             st.write(suggestion['description'])
             
             try:
-                fig = render_visualization(df, suggestion['config'])
-                st.plotly_chart(fig, use_container_width=True)
+                # Only build the figure when the user asks for a preview
+                if st.toggle("Show preview", key=f"suggestion_preview_{i}"):
+                    fig = cached_render_visualization(df, suggestion['config'])
+                    st.plotly_chart(fig, use_container_width=True)
                 
                 if st.button(f"Use This Visualization #{i+1}"):
                     # Set up this visualization in the builder
                     viz_name = f"Suggested Viz {i+1}"
-                    save_visualization(viz_name, suggestion['config'])
-                    st.success(f"Visualization saved as '{viz_name}'")
+                    save_visualization(viz_name, suggestion['config'], df)
             except Exception as e:
                 st.error(f"Error generating suggestion: {str(e)}")
+
+with tab4:
+    suggestions_tab(df)
@@ -1,8 +1,8 @@
 import streamlit as st
 import pandas as pd
-from utils.data_processor import list_uploaded_files, get_dataframe
-from utils.templates import get_industry_templates, apply_template
-from utils.visualization import render_visualization
+from utils.data_processor import list_uploaded_files, get_dataframe, normalize_column_name, get_normalized_columns, get_dataframe_columns, get_dataframe_head, get_dataset_overview
+from utils.templates import get_industry_template_meta, get_template, apply_template
+from utils.visualization import cached_render_visualization
 
 st.set_page_config(
     page_title="Industry Templates - DataVizSME",
@@ -38,15 +38,17 @@ selected_file = st.selectbox(
 try:
     df = get_dataframe(selected_file)
     st.session_state.current_file = selected_file
+    columns = get_dataframe_columns(selected_file)
+    normalized_columns = get_normalized_columns(selected_file)
 except Exception as e:
     st.error(f"Error loading dataset: {str(e)}")
     st.stop()
 
 # Display dataset info
 with st.expander("Dataset Preview"):
-    st.dataframe(df.head(10))
-    st.write(f"Shape: {df.shape[0]} rows, {df.shape[1]} columns")
-    st.write(f"Columns: {', '.join(df.columns)}")
+    st.dataframe(get_dataframe_head(selected_file))
+    for line in get_dataset_overview(selected_file):
+        st.write(line)
 
 # Industry selection
 industries = [
@@ -61,11 +63,11 @@ industries = [
 
 selected_industry = st.selectbox("Select your industry:", industries)
 
-# Get templates for selected industry
-templates = get_industry_templates(selected_industry)
+# Get template names, descriptions and fields for the selected industry
+template_meta = get_industry_template_meta(selected_industry)
 
 # Display templates
-if not templates:
+if not template_meta['name']:
     st.info(f"No templates available for {selected_industry} yet.")
 else:
     # Display as cards in a grid
@@ -74,17 +76,17 @@ else:
     # Use columns to create a grid layout
     cols = st.columns(2)
     
-    for i, template in enumerate(templates):
+    template_cards = zip(template_meta['name'], template_meta['description'], template_meta['required_fields'])
+    for i, (name, description, required_fields) in enumerate(template_cards):
         with cols[i % 2]:
             with st.container(border=True):
-                st.subheader(template['name'])
-                st.write(template['description'])
-                st.write(f"**Required fields:** {', '.join(template['required_fields'])}")
+                st.subheader(name)
+                st.write(description)
+                st.write(f"**Required fields:** {', '.join(required_fields)}")
                 
                 # Check if dataset has required fields
-                missing_fields = [field for field in template['required_fields'] 
-                                 if not any(col.lower().replace('_', ' ').replace('-', ' ') == field.lower().replace('_', ' ').replace('-', ' ') 
-                                           for col in df.columns)]
+                missing_fields = [field for field in required_fields 
+                                 if normalize_column_name(field) not in normalized_columns]
                 
                 if missing_fields:
                     st.warning(f"Missing fields: {', '.join(missing_fields)}")
@@ -94,32 +96,34 @@ else:
                     st.success("Your dataset has all required fields!")
                     can_use = True
                 
-                if st.button(f"Use Template: {template['name']}", key=f"use_template_{i}", disabled=not can_use):
-                    st.session_state.selected_template = template
+                if st.button(f"Use Template: {name}", key=f"use_template_{i}", disabled=not can_use):
+                    # Keep only the template's key; the template itself stays in the shared catalog
+                    st.session_state.selected_template = (selected_industry, name)
                     st.rerun()
 
 # If a template is selected, show the mapping and preview
 if 'selected_template' in st.session_state:
-    template = st.session_state.selected_template
+    template = get_template(*st.session_state.selected_template)
     
     st.markdown("---")
-    st.subheader(f"Applying Template: {template['name']}")
+    st.subheader(f"Applying Template: {template.name}")
     
     # Field mapping (if needed)
     st.write("### Map Your Data Fields")
     st.write("Match your dataset columns to the template's required fields")
     
+    # Options and their positions are the same for every field, so build them once
+    column_options = ("",) + tuple(columns)
+    option_index = {col: i for i, col in enumerate(column_options)}
+    
     field_mapping = {}
-    for required_field in template['required_fields']:
+    for required_field in template.required_fields:
         # Try to find closest match in dataset
-        matches = [col for col in df.columns 
-                  if col.lower().replace('_', ' ').replace('-', ' ') == required_field.lower().replace('_', ' ').replace('-', ' ')]
-        
-        default_value = matches[0] if matches else None
+        default_value = normalized_columns.get(normalize_column_name(required_field), "")
         field_mapping[required_field] = st.selectbox(
             f"Map '{required_field}' to:", 
-            options=[""] + list(df.columns),
-            index=0 if default_value is None else list(df.columns).index(default_value) + 1
+            options=column_options,
+            index=option_index[default_value]
         )
     
     # Check if all fields are mapped
@@ -139,7 +143,7 @@ if 'selected_template' in st.session_state:
                 st.write(f"#### {viz['title']}")
                 
                 try:
-                    fig = render_visualization(df, viz['config'])
+                    fig = cached_render_visualization(df, viz['config'])
                     st.plotly_chart(fig, use_container_width=True)
                 except Exception as e:
                     st.error(f"Error rendering visualization: {str(e)}")
@@ -147,10 +151,12 @@ if 'selected_template' in st.session_state:
             # Save template option
             if st.button("Save All Template Visualizations"):
                 for viz in visualizations:
-                    viz_name = f"{template['name']} - {viz['title']}"
+                    viz_name = f"{template.name} - {viz['title']}"
                     st.session_state.visualizations[viz_name] = viz['config']
+                    # Drop any figure cached for a previous visualization with this name
+                    st.session_state.get('visualization_figures', {}).pop(viz_name, None)
                 
-                st.success(f"Saved {len(visualizations)} visualizations from the {template['name']} template!")
+                st.success(f"Saved {len(visualizations)} visualizations from the {template.name} template!")
                 
         except Exception as e:
             st.error(f"Error applying template: {str(e)}")
@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
-import json
+import time
+import datetime
 from utils.integration import get_available_integrations, setup_integration, get_integration_data
 from utils.data_processor import save_dataframe
 
@@ -88,12 +89,12 @@ with tab2:
                                 
                                 if data and all(key in data for key in ['filename', 'data']):
                                     # Save the data as a dataframe
-                                    df = pd.DataFrame(data['data'])
+                                    df = data['data']
                                     save_dataframe(data['filename'], df)
                                     
                                     # Update status
                                     st.session_state.active_integrations[integration_id]['status'] = 'Connected'
-                                    st.session_state.active_integrations[integration_id]['last_sync'] = pd.Timestamp.now().strftime("%Y-%m-%d %H:%M")
+                                    st.session_state.active_integrations[integration_id]['last_sync'] = time.strftime("%Y-%m-%d %H:%M")
                                     
                                     st.success(f"Data from {integration_details['name']} has been synchronized!")
                                     st.rerun()
@@ -123,36 +124,47 @@ if 'selected_integration' in st.session_state and 'integration_action' in st.ses
         # Display authentication fields based on integration type
         auth_fields = {}
         
-        if integration['auth_type'] == 'api_key':
-            auth_fields['api_key'] = st.text_input("API Key", type="password")
-            
-        elif integration['auth_type'] == 'oauth':
+        # Buttons are not allowed inside forms, so OAuth authorization happens
+        # first and its token is kept in session state until the form is submitted
+        if integration['auth_type'] == 'oauth':
+            oauth_key = f"oauth_{integration['id']}"
             st.info("This integration requires OAuth authentication. Click the button below to authorize.")
             if st.button("Authorize"):
                 # In a real app, this would redirect to the OAuth flow
                 # For this demo, we'll simulate successful authorization
-                auth_fields['oauth_token'] = "simulated_oauth_token"
-                auth_fields['oauth_secret'] = "simulated_oauth_secret"
+                st.session_state[oauth_key] = {
+                    'oauth_token': "simulated_oauth_token",
+                    'oauth_secret': "simulated_oauth_secret"
+                }
+            if oauth_key in st.session_state:
+                auth_fields.update(st.session_state[oauth_key])
                 st.success("Authorization successful!")
+        
+        # Collect the remaining fields in a form so typing doesn't rerun the page
+        with st.form("integration_setup"):
+            if integration['auth_type'] == 'api_key':
+                auth_fields['api_key'] = st.text_input("API Key", type="password")
                 
-        elif integration['auth_type'] == 'credentials':
-            auth_fields['username'] = st.text_input("Username")
-            auth_fields['password'] = st.text_input("Password", type="password")
+            elif integration['auth_type'] == 'credentials':
+                auth_fields['username'] = st.text_input("Username")
+                auth_fields['password'] = st.text_input("Password", type="password")
+                
+            # Additional configuration fields
+            st.subheader("Configuration")
             
-        # Additional configuration fields
-        st.subheader("Configuration")
-        
-        if 'config_fields' in integration:
-            for field in integration['config_fields']:
-                if field['type'] == 'text':
-                    auth_fields[field['id']] = st.text_input(field['label'], placeholder=field.get('placeholder', ''))
-                elif field['type'] == 'select':
-                    auth_fields[field['id']] = st.selectbox(field['label'], field['options'])
-                elif field['type'] == 'number':
-                    auth_fields[field['id']] = st.number_input(field['label'], min_value=field.get('min', 0))
+            if 'config_fields' in integration:
+                for field in integration['config_fields']:
+                    if field['type'] == 'text':
+                        auth_fields[field['id']] = st.text_input(field['label'], placeholder=field.get('placeholder', ''))
+                    elif field['type'] == 'select':
+                        auth_fields[field['id']] = st.selectbox(field['label'], field['options'])
+                    elif field['type'] == 'number':
+                        auth_fields[field['id']] = st.number_input(field['label'], min_value=field.get('min', 0))
+            
+            submitted = st.form_submit_button("Connect to Service")
         
         # Connect button
-        if st.button("Connect to Service"):
+        if submitted:
             # Validate required fields
             required_fields = integration.get('required_fields', [])
             missing_fields = [field for field in required_fields if field not in auth_fields or not auth_fields[field]]
@@ -169,7 +181,7 @@ if 'selected_integration' in st.session_state and 'integration_action' in st.ses
                         st.session_state.active_integrations[integration['id']] = {
                             'status': 'Connected',
                             'auth': auth_fields,
-                            'last_sync': pd.Timestamp.now().strftime("%Y-%m-%d %H:%M")
+                            'last_sync': time.strftime("%Y-%m-%d %H:%M")
                         }
                         
                         st.success(f"Successfully connected to {integration['name']}!")
@@ -177,6 +189,7 @@ if 'selected_integration' in st.session_state and 'integration_action' in st.ses
                         # Clean up session state
                         del st.session_state.selected_integration
                         del st.session_state.integration_action
+                        st.session_state.pop(f"oauth_{integration['id']}", None)
                         
                         st.rerun()
                     else:
@@ -188,6 +201,7 @@ if 'selected_integration' in st.session_state and 'integration_action' in st.ses
         if st.button("Cancel"):
             del st.session_state.selected_integration
             del st.session_state.integration_action
+            st.session_state.pop(f"oauth_{integration['id']}", None)
             st.rerun()
             
     elif action == "manage":
@@ -213,11 +227,15 @@ if 'selected_integration' in st.session_state and 'integration_action' in st.ses
         else:
             data_types = ["All Data"]
         
-        selected_data = st.multiselect("Select data to import:", data_types, default=data_types[0])
-        
-        date_range = st.date_input("Date range:", value=[pd.Timestamp.now() - pd.Timedelta(days=30), pd.Timestamp.now()])
+        with st.form("integration_sync"):
+            selected_data = st.multiselect("Select data to import:", data_types, default=data_types[0])
+            
+            today = datetime.date.today()
+            date_range = st.date_input("Date range:", value=[today - datetime.timedelta(days=30), today])
+            
+            sync_submitted = st.form_submit_button("Sync Selected Data")
         
-        if st.button("Sync Selected Data"):
+        if sync_submitted:
             if not selected_data:
                 st.warning("Please select at least one data type to import.")
             else:
@@ -225,7 +243,6 @@ if 'selected_integration' in st.session_state and 'integration_action' in st.ses
                     # Get data from integration
                     with st.spinner(f"Syncing data from {integration['name']}..."):
                         # Simulate API call delay
-                        import time
                         time.sleep(2)
                         
                         # For each selected data type, create a mock dataset
@@ -244,7 +261,7 @@ if 'selected_integration' in st.session_state and 'integration_action' in st.ses
                             
                             if mock_data and 'data' in mock_data:
                                 # Save the data as a dataframe
-                                df = pd.DataFrame(mock_data['data'])
+                                df = mock_data['data']
                                 save_dataframe(filename, df)
                                 
                                 st.success(f"Imported {len(df)} records of {data_type} data from {integration['name']}")
@@ -252,7 +269,7 @@ if 'selected_integration' in st.session_state and 'integration_action' in st.ses
                                 st.warning(f"No {data_type} data available for the selected period")
                         
                         # Update the last sync time
-                        st.session_state.active_integrations[integration['id']]['last_sync'] = pd.Timestamp.now().strftime("%Y-%m-%d %H:%M")
+                        st.session_state.active_integrations[integration['id']]['last_sync'] = time.strftime("%Y-%m-%d %H:%M")
                         
                 except Exception as e:
                     st.error(f"Error synchronizing data: {str(e)}")
@@ -0,0 +1,271 @@
+# Static catalog of industry visualization templates, served by utils.templates
+
+def _visualization(label, chart_type, title, **fields):
+    """One template visualization; fields passed as None are left out of its config"""
+    config = {'chart_type': chart_type}
+    config.update((field, value) for field, value in fields.items() if value is not None)
+    config['title'] = title
+    return {'title': label, 'config': config}
+
+def _line(label, x, y, title, color=None, markers=False):
+    """Line chart visualization (markers are only set when enabled)"""
+    return _visualization(label, 'line_chart', title, x=x, y=y, color=color, markers=True if markers else None)
+
+def _bar(label, x, y, title, color=None):
+    """Bar chart visualization"""
+    return _visualization(label, 'bar_chart', title, x=x, y=y, color=color)
+
+def _pie(label, names, values, title):
+    """Pie chart visualization"""
+    return _visualization(label, 'pie_chart', title, names=names, values=values)
+
+def _scatter(label, x, y, title, color=None, size=None):
+    """Scatter plot visualization"""
+    return _visualization(label, 'scatter_plot', title, x=x, y=y, color=color, size=size)
+
+def _histogram(label, x, bins, title, color=None):
+    """Histogram visualization"""
+    return _visualization(label, 'histogram', title, x=x, color=color, bins=bins)
+
+def _box(label, x, y, title):
+    """Box plot visualization"""
+    return _visualization(label, 'box_plot', title, y=y, x=x)
+
+def build_retail_templates():
+    """Build the Retail & E-commerce templates"""
+    return [
+        {
+            'name': 'Sales Performance Dashboard',
+            'description': 'Track sales performance over time with breakdowns by product category and customer segments',
+            'required_fields': ['Date', 'Sales', 'Product Category', 'Customer Segment'],
+            'visualizations': [
+                _line('Sales Trend', x='Date', y='Sales', markers=True, title='Sales Trend Over Time'),
+                _bar('Sales by Category', x='Product Category', y='Sales', title='Sales by Product Category'),
+                _pie('Customer Segment Distribution', names='Customer Segment', values='Sales', title='Sales by Customer Segment')
+            ]
+        },
+        {
+            'name': 'Customer Insights Dashboard',
+            'description': 'Analyze customer behavior, demographics, and purchasing patterns',
+            'required_fields': ['Customer ID', 'Age', 'Gender', 'Purchase Amount', 'Date'],
+            'visualizations': [
+                _histogram('Customer Age Distribution', x='Age', bins=15, title='Customer Age Distribution'),
+                _box('Purchase Amount by Gender', x='Gender', y='Purchase Amount', title='Purchase Amount by Gender'),
+                _line('Purchase Trends', x='Date', y='Purchase Amount', title='Purchase Trends Over Time')
+            ]
+        },
+        {
+            'name': 'Inventory Analysis',
+            'description': 'Monitor inventory levels, turnover rates, and stock efficiency',
+            'required_fields': ['Product', 'Stock Level', 'Reorder Point', 'Cost', 'Sales'],
+            'visualizations': [
+                _bar('Stock Levels vs Reorder Points', x='Product', y='Stock Level', title='Current Stock vs Reorder Points'),
+                _pie('Inventory Value Distribution', names='Product', values='Cost', title='Inventory Value by Product'),
+                _scatter('Sales to Stock Ratio', x='Stock Level', y='Sales', title='Sales to Stock Level Correlation')
+            ]
+        }
+    ]
+
+def build_financial_services_templates():
+    """Build the Financial Services templates"""
+    return [
+        {
+            'name': 'Financial Performance Overview',
+            'description': 'Track revenue, expenses, and profitability over time',
+            'required_fields': ['Date', 'Revenue', 'Expenses', 'Profit', 'Department'],
+            'visualizations': [
+                _line('Profit & Loss Trend', x='Date', y='Profit', markers=True, title='Profit Trend Over Time'),
+                _bar('Revenue vs Expenses', x='Date', y='Revenue', title='Revenue vs Expenses by Period'),
+                _pie('Department Profitability', names='Department', values='Profit', title='Profit by Department')
+            ]
+        },
+        {
+            'name': 'Cash Flow Analysis',
+            'description': 'Visualize cash inflows, outflows, and net cash position',
+            'required_fields': ['Date', 'Cash In', 'Cash Out', 'Category', 'Net Cash'],
+            'visualizations': [
+                _line('Cash Flow Trend', x='Date', y='Net Cash', markers=True, title='Net Cash Position Over Time'),
+                _bar('Cash Inflows vs Outflows', x='Date', y='Cash In', title='Cash Inflows vs Outflows by Period'),
+                _pie('Cash Flow by Category', names='Category', values='Cash In', title='Cash Inflows by Category')
+            ]
+        },
+        {
+            'name': 'Client Portfolio Analysis',
+            'description': 'Analyze client portfolios, asset allocation, and performance',
+            'required_fields': ['Client', 'Asset Class', 'Investment Amount', 'Return', 'Risk Score'],
+            'visualizations': [
+                _pie('Asset Allocation', names='Asset Class', values='Investment Amount', title='Asset Allocation by Class'),
+                _scatter('Risk vs Return', x='Risk Score', y='Return', title='Risk vs Return by Asset Class'),
+                _bar('Client Investment Distribution', x='Client', y='Investment Amount', color='Asset Class', title='Investment Distribution by Client')
+            ]
+        }
+    ]
+
+def build_manufacturing_templates():
+    """Build the Manufacturing templates"""
+    return [
+        {
+            'name': 'Production Performance',
+            'description': 'Track production output, efficiency, and quality metrics',
+            'required_fields': ['Date', 'Production Output', 'Efficiency', 'Defect Rate', 'Product Line'],
+            'visualizations': [
+                _line('Production Trend', x='Date', y='Production Output', color='Product Line', markers=True, title='Production Output Over Time'),
+                _bar('Efficiency Analysis', x='Product Line', y='Efficiency', title='Production Efficiency by Product Line'),
+                _scatter('Quality Control', x='Production Output', y='Defect Rate', color='Product Line', title='Defect Rate vs Production Output')
+            ]
+        },
+        {
+            'name': 'Supply Chain Overview',
+            'description': 'Analyze supplier performance, material costs, and inventory levels',
+            'required_fields': ['Supplier', 'Material', 'Cost', 'Lead Time', 'Quality Score'],
+            'visualizations': [
+                _scatter('Supplier Performance', x='Lead Time', y='Quality Score', color='Supplier', size='Cost', title='Supplier Performance Matrix'),
+                _pie('Material Cost Distribution', names='Material', values='Cost', title='Material Cost Distribution'),
+                _box('Supplier Lead Times', x='Supplier', y='Lead Time', title='Lead Time Distribution by Supplier')
+            ]
+        },
+        {
+            'name': 'Equipment Effectiveness',
+            'description': 'Monitor equipment performance, downtime, and maintenance metrics',
+            'required_fields': ['Equipment', 'Uptime', 'Downtime', 'Maintenance Cost', 'Date'],
+            'visualizations': [
+                _bar('Equipment Uptime', x='Equipment', y='Uptime', title='Equipment Uptime Percentage'),
+                _line('Maintenance Cost Trend', x='Date', y='Maintenance Cost', color='Equipment', title='Maintenance Costs Over Time'),
+                _pie('Downtime Analysis', names='Equipment', values='Downtime', title='Downtime Distribution by Equipment')
+            ]
+        }
+    ]
+
+def build_healthcare_templates():
+    """Build the Healthcare templates"""
+    return [
+        {
+            'name': 'Patient Analytics',
+            'description': 'Analyze patient demographics, visits, and treatment outcomes',
+            'required_fields': ['Patient ID', 'Age', 'Gender', 'Diagnosis', 'Treatment', 'Outcome'],
+            'visualizations': [
+                _histogram('Patient Age Distribution', x='Age', color='Gender', bins=20, title='Patient Age Distribution'),
+                _pie('Diagnosis Breakdown', names='Diagnosis', values='Patient ID', title='Patient Distribution by Diagnosis'),
+                _bar('Treatment Outcomes', x='Treatment', y='Outcome', title='Treatment Effectiveness Analysis')
+            ]
+        },
+        {
+            'name': 'Practice Performance',
+            'description': 'Track practice revenue, patient volume, and operational metrics',
+            'required_fields': ['Date', 'Revenue', 'Patient Visits', 'Department', 'Cost'],
+            'visualizations': [
+                _line('Revenue Trend', x='Date', y='Revenue', markers=True, title='Revenue Trend Over Time'),
+                _bar('Patient Visit Volume', x='Date', y='Patient Visits', color='Department', title='Patient Visits by Department'),
+                _scatter('Department Profitability', x='Cost', y='Revenue', color='Department', title='Revenue vs Cost by Department')
+            ]
+        }
+    ]
+
+def build_professional_services_templates():
+    """Build the Professional Services templates"""
+    return [
+        {
+            'name': 'Client Engagement Analysis',
+            'description': 'Analyze client engagements, billable hours, and project profitability',
+            'required_fields': ['Client', 'Project', 'Billable Hours', 'Revenue', 'Cost', 'Date'],
+            'visualizations': [
+                _line('Billable Hours Trend', x='Date', y='Billable Hours', color='Client', markers=True, title='Billable Hours Over Time'),
+                _bar('Project Profitability', x='Project', y='Revenue', title='Revenue vs Cost by Project'),
+                _pie('Client Revenue Distribution', names='Client', values='Revenue', title='Revenue Distribution by Client')
+            ]
+        },
+        {
+            'name': 'Staff Utilization Dashboard',
+            'description': 'Track staff utilization, billable rates, and efficiency',
+            'required_fields': ['Employee', 'Billable Hours', 'Available Hours', 'Billable Rate', 'Department'],
+            'visualizations': [
+                _bar('Utilization Rates', x='Employee', y='Billable Hours', title='Utilization Rate by Employee'),
+                _box('Department Utilization', x='Department', y='Billable Hours', title='Utilization Distribution by Department'),
+                _scatter('Billable Rate Analysis', x='Billable Hours', y='Billable Rate', color='Department', title='Billable Rate vs Hours')
+            ]
+        }
+    ]
+
+def build_hospitality_templates():
+    """Build the Hospitality & Food Service templates"""
+    return [
+        {
+            'name': 'Sales & Revenue Dashboard',
+            'description': 'Track sales, revenue, and customer metrics for hospitality businesses',
+            'required_fields': ['Date', 'Sales', 'Customer Count', 'Average Check', 'Product Category'],
+            'visualizations': [
+                _line('Daily Sales Trend', x='Date', y='Sales', markers=True, title='Sales Trend Over Time'),
+                _pie('Sales by Category', names='Product Category', values='Sales', title='Sales Distribution by Category'),
+                _scatter('Customer Volume vs Average Check', x='Customer Count', y='Average Check', color='Product Category', title='Customer Volume vs Average Check')
+            ]
+        },
+        {
+            'name': 'Menu Performance Analysis',
+            'description': 'Analyze menu item performance, popularity, and profitability',
+            'required_fields': ['Menu Item', 'Orders', 'Revenue', 'Food Cost', 'Category'],
+            'visualizations': [
+                _bar('Item Popularity', x='Menu Item', y='Orders', color='Category', title='Most Popular Menu Items'),
+                _scatter('Item Profitability', x='Food Cost', y='Revenue', color='Category', title='Menu Item Profitability'),
+                _pie('Revenue by Category', names='Category', values='Revenue', title='Revenue Distribution by Category')
+            ]
+        }
+    ]
+
+def build_real_estate_templates():
+    """Build the Real Estate & Construction templates"""
+    return [
+        {
+            'name': 'Property Performance Dashboard',
+            'description': 'Analyze property performance, occupancy rates, and rental income',
+            'required_fields': ['Property', 'Rental Income', 'Occupancy Rate', 'Expenses', 'Date'],
+            'visualizations': [
+                _line('Income Trend', x='Date', y='Rental Income', color='Property', markers=True, title='Rental Income Over Time'),
+                _bar('Occupancy Analysis', x='Property', y='Occupancy Rate', title='Occupancy Rate by Property'),
+                _scatter('Income vs Expenses', x='Expenses', y='Rental Income', color='Property', title='Income vs Expenses by Property')
+            ]
+        },
+        {
+            'name': 'Construction Project Tracking',
+            'description': 'Monitor construction project progress, costs, and timelines',
+            'required_fields': ['Project', 'Actual Cost', 'Budgeted Cost', 'Completion Percentage', 'Date'],
+            'visualizations': [
+                _bar('Project Progress', x='Project', y='Completion Percentage', title='Project Completion Status'),
+                _bar('Budget vs Actual', x='Project', y='Actual Cost', title='Budget vs Actual Cost'),
+                _line('Cost Trend', x='Date', y='Actual Cost', color='Project', title='Project Cost Over Time')
+            ]
+        }
+    ]
+
+def build_default_templates():
+    """Build the default templates, used for industries without their own"""
+    return [
+        {
+            'name': 'General Business Performance',
+            'description': 'Track key business metrics and performance indicators',
+            'required_fields': ['Date', 'Revenue', 'Expenses', 'Profit'],
+            'visualizations': [
+                _line('Revenue & Profit Trend', x='Date', y='Revenue', markers=True, title='Revenue & Profit Over Time'),
+                _bar('Profit Margin Analysis', x='Date', y='Profit', title='Profit Margin Analysis')
+            ]
+        },
+        {
+            'name': 'Customer Analysis',
+            'description': 'Analyze customer data and purchasing behavior',
+            'required_fields': ['Customer', 'Purchase Amount', 'Date', 'Product'],
+            'visualizations': [
+                _bar('Top Customers', x='Customer', y='Purchase Amount', title='Top Customers by Purchase Amount'),
+                _line('Purchase Trend', x='Date', y='Purchase Amount', title='Purchase Trend Over Time')
+            ]
+        }
+    ]
+
+# Industry -> function building its templates; each list is built on first use
+TEMPLATE_BUILDERS = {
+    "Retail & E-commerce": build_retail_templates,
+    "Financial Services": build_financial_services_templates,
+    "Manufacturing": build_manufacturing_templates,
+    "Healthcare": build_healthcare_templates,
+    "Professional Services": build_professional_services_templates,
+    "Hospitality & Food Service": build_hospitality_templates,
+    "Real Estate & Construction": build_real_estate_templates
+}
@@ -1,9 +1,216 @@
 import pandas as pd
+import numpy as np
+import hashlib
 import os
+import re
 import json
+import warnings
+import weakref
 from io import StringIO
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import streamlit as st
 
+# id(df) -> (weakref to df, fingerprint); entries are dropped when the frame is collected
+_fingerprints = {}
+
+def dataframe_fingerprint(df):
+    """Content-based cache key for a dataframe (schema, shape and row hashes)
+    
+    The row hash is computed once per frame object and reused, so repeated
+    cache lookups on the same stored dataset cost O(1).
+    """
+    key = id(df)
+    entry = _fingerprints.get(key)
+    if entry is not None and entry[0]() is df:
+        return entry[1]
+    
+    fingerprint = (
+        tuple(map(str, df.columns)),
+        tuple(map(str, df.dtypes)),
+        df.shape,
+        # Digest the row hashes in order, so a reordered frame gets a different key
+        hashlib.blake2b(pd.util.hash_pandas_object(df).to_numpy().tobytes()).hexdigest()
+    )
+    _fingerprints[key] = (weakref.ref(df, lambda _, key=key: _fingerprints.pop(key, None)), fingerprint)
+    return fingerprint
+
+# hash_funcs for st.cache_data on functions that take a dataframe argument
+DATAFRAME_HASH_FUNCS = {pd.DataFrame: dataframe_fingerprint}
+
+def _arrow_stream(source):
+    """Input for the pyarrow CSV readers, starting from the beginning of source"""
+    # Uploads are already held in memory: let pyarrow read that buffer in place
+    # instead of copying it through the Python file interface
+    if hasattr(source, 'getbuffer'):
+        return pa.BufferReader(pa.py_buffer(source.getbuffer()))
+    source.seek(0)
+    return source
+
+# Read blank and "" cells as missing, as pd.read_csv does (pyarrow keeps them as empty strings by default)
+CSV_CONVERT_OPTIONS = pa_csv.ConvertOptions(strings_can_be_null=True, quoted_strings_can_be_null=True)
+
+def _unique_header(names):
+    """Whether pyarrow's column names are usable as is: pandas renames empty and repeated headers"""
+    return all(names) and len(set(names)) == len(names)
+
+def read_csv_file(source):
+    """Parse a CSV file with the multithreaded pyarrow reader"""
+    try:
+        table = pa_csv.read_csv(_arrow_stream(source), convert_options=CSV_CONVERT_OPTIONS)
+    except pa.ArrowInvalid:
+        table = None
+    
+    # Fall back to the pandas C parser, which tolerates more malformed input and
+    # names empty or repeated headers (Unnamed: 2, a.1) so every column can be selected
+    if table is None or not _unique_header(table.column_names):
+        source.seek(0)
+        return pd.read_csv(source)
+    
+    # Keep numpy-backed dtypes so select_dtypes() and the chart builders behave as before
+    return table.to_pandas(date_as_object=False)
+
+def read_excel_file(source):
+    """Parse an Excel file (.xlsx or .xls) with the Rust-based calamine engine"""
+    return pd.read_excel(source, engine="calamine")
+
+def _sweep_columns(df):
+    """Return (null_count, uint64 row signatures) from one pass over the columns"""
+    null_count = 0
+    row_hashes = np.zeros(len(df), dtype=np.uint64)
+    
+    # Each column is read once while it is hot: count its nulls and fold its
+    # hash into the per-row signature used for duplicate detection
+    for _, series in df.items():
+        null_count += int(series.isna().sum())
+        column_hashes = pd.util.hash_pandas_object(series, index=False).to_numpy()
+        row_hashes = row_hashes * np.uint64(1000003) ^ column_hashes
+    
+    return null_count, row_hashes
+
+def frame_summary(df):
+    """Return (rows, columns, null_count, duplicate_count) from one sweep over the columns"""
+    rows, columns = df.shape
+    null_count, row_hashes = _sweep_columns(df)
+    duplicate_count = int(pd.Series(row_hashes).duplicated().sum()) if columns else 0
+    return rows, columns, null_count, duplicate_count
+
+def summarize_dataframe(df):
+    """Preview rows plus shape, missing and exact duplicate counts for a dataframe"""
+    rows, columns, missing, duplicates = frame_summary(df)
+    return {
+        'head': df.head(10),
+        'rows': rows,
+        'columns': columns,
+        'missing': missing,
+        'duplicates': duplicates
+    }
+
+def _count_new_duplicates(row_hashes, seen):
+    """Count rows whose hash is already in seen or earlier in row_hashes; return (count, updated seen)"""
+    unique_hashes = np.unique(row_hashes)
+    duplicates = len(row_hashes) - len(unique_hashes)
+    duplicates += int(np.isin(unique_hashes, seen, assume_unique=True).sum())
+    return duplicates, np.union1d(seen, unique_hashes)
+
+def scan_csv_file(source):
+    """Compute summarize_dataframe() stats for a CSV file chunk by chunk
+    
+    Chunks come from the streaming form of the pyarrow reader read_csv_file uses, so
+    the preview shows the dtypes that get saved. Duplicates are counted exactly from
+    a running set of row hashes. Files the streaming reader rejects, or whose headers
+    pandas would rename, are parsed with read_csv_file and summarized whole.
+    """
+    summary = {'head': None, 'rows': 0, 'columns': 0, 'missing': 0, 'duplicates': 0}
+    seen_hashes = np.empty(0, dtype=np.uint64)
+    
+    try:
+        reader = pa_csv.open_csv(_arrow_stream(source), convert_options=CSV_CONVERT_OPTIONS)
+        if _unique_header(reader.schema.names):
+            for batch in reader:
+                chunk = batch.to_pandas(date_as_object=False)
+                if summary['head'] is None:
+                    summary['head'] = chunk.head(10)
+                    summary['columns'] = chunk.shape[1]
+                
+                null_count, row_hashes = _sweep_columns(chunk)
+                summary['rows'] += len(chunk)
+                summary['missing'] += null_count
+                if summary['columns']:
+                    duplicates, seen_hashes = _count_new_duplicates(row_hashes, seen_hashes)
+                    summary['duplicates'] += duplicates
+            
+            source.seek(0)
+            return summary
+    except pa.ArrowInvalid:
+        pass
+    
+    # The streaming reader fixes column types from the first block and keeps headers
+    # as written; let the full reader (and its pandas fallback) handle anything else
+    summary = summarize_dataframe(read_csv_file(source))
+    source.seek(0)
+    return summary
+
+# Numeric dates such as 2023-01-31, 31/01/2023 or 1/5/23 (optionally followed by a time)
+DATE_RE = re.compile(r'^\s*\d{1,4}[-/]\d{1,2}[-/]\d{1,4}')
+
+def looks_like_datetime(series, sample_size=50, threshold=0.95, probe_size=20):
+    """Guess whether a text column holds dates by parsing a small random sample"""
+    if not pd.api.types.is_object_dtype(series):
+        return False
+    
+    values = series.dropna()
+    if values.empty:
+        return False
+    
+    # Cheap regex probe on the first few values gates the much costlier date parser
+    if not values.head(probe_size).astype(str).map(DATE_RE.match).all():
+        return False
+    
+    sample = values.sample(min(sample_size, len(values)), random_state=0)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        parsed = pd.to_datetime(sample, errors='coerce')
+    
+    return parsed.notna().mean() >= threshold
+
+# ISO 8601 dates, optionally with a time: the only text save_dataframe converts to datetime64
+ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,9})?)?)?')
+
+def _parse_datetime_column(series, sample_size=100):
+    """Return the series as datetime64 if every non-null value is an ISO date or datetime, else None"""
+    values = series.dropna()
+    if values.empty or pd.api.types.infer_dtype(values.head(sample_size)) != 'string':
+        return None
+    
+    # Reject most non-date columns from a small sample before matching everything
+    for part in (values.head(sample_size), values):
+        if not part.str.fullmatch(ISO_DATE_RE).fillna(False).all():
+            return None
+    
+    # Impossible dates such as 2023-02-30 pass the pattern but not the parser
+    parsed = pd.to_datetime(series, format='ISO8601', errors='coerce')
+    if parsed.notna().sum() != len(values):
+        return None
+    return parsed
+
+def convert_date_columns(df):
+    """Convert text columns that hold ISO dates or datetimes to datetime64, leaving all others as they are"""
+    converted = {}
+    for col in df.columns:
+        if df[col].dtype == object:
+            parsed = _parse_datetime_column(df[col])
+            if parsed is not None:
+                converted[col] = parsed
+    
+    if not converted:
+        return df
+    
+    df = df.copy()
+    for col, parsed in converted.items():
+        df[col] = parsed
+    return df
+
 # Define a simple file storage mechanism using session state
 # In a real application, this would use a database or file system
 def save_dataframe(filename, df):
@@ -11,7 +218,16 @@ def save_dataframe(filename, df):
     if 'uploaded_files' not in st.session_state:
         st.session_state.uploaded_files = {}
     
+    # Parse date-like text once here so every page sees real datetime columns
+    df = convert_date_columns(df)
+    
+    # Hash the content once up front; every cached analysis/render keyed on this
+    # frame then reuses the memoized fingerprint instead of rehashing on a rerun
+    dataframe_fingerprint(df)
+    
     st.session_state.uploaded_files[filename] = df
+    st.session_state.uploaded_files_list = tuple(st.session_state.uploaded_files)
+    _clear_dataset_cache(filename)
     return True
 
 def get_dataframe(filename):
@@ -28,67 +244,203 @@ def delete_dataframe(filename):
     """Delete a dataframe from session state storage"""
     if 'uploaded_files' in st.session_state and filename in st.session_state.uploaded_files:
         del st.session_state.uploaded_files[filename]
+        st.session_state.uploaded_files_list = tuple(st.session_state.uploaded_files)
+        _clear_dataset_cache(filename)
         return True
     return False
 
 def list_uploaded_files():
-    """List all files in the session state storage"""
+    """List all files in the session state storage (kept as a tuple, rebuilt only on save/delete)"""
     if 'uploaded_files' not in st.session_state:
         st.session_state.uploaded_files = {}
+    if 'uploaded_files_list' not in st.session_state:
+        st.session_state.uploaded_files_list = tuple(st.session_state.uploaded_files)
+    
+    return st.session_state.uploaded_files_list
+
+def _dataset_cache(filename):
+    """Per-session memo of values derived from a stored dataset"""
+    if 'dataset_cache' not in st.session_state:
+        st.session_state.dataset_cache = {}
+    
+    return st.session_state.dataset_cache.setdefault(filename, {})
+
+def _clear_dataset_cache(filename):
+    """Drop memoized values for a dataset that was replaced or removed"""
+    if 'dataset_cache' in st.session_state:
+        st.session_state.dataset_cache.pop(filename, None)
+
+def get_column_groups(filename):
+    """Return (numeric, categorical, temporal, all) column lists for a stored dataset"""
+    cache = _dataset_cache(filename)
+    
+    if 'column_groups' not in cache:
+        df = get_dataframe(filename)
+        cache['column_groups'] = (
+            df.select_dtypes(include=['int64', 'float64']).columns.tolist(),
+            df.select_dtypes(include=['object', 'category', 'bool']).columns.tolist(),
+            df.select_dtypes(include=['datetime64']).columns.tolist(),
+            df.columns.tolist()
+        )
     
-    return list(st.session_state.uploaded_files.keys())
+    return cache['column_groups']
 
+def get_dataframe_columns(filename):
+    """Return the column names of a stored dataset as a tuple"""
+    cache = _dataset_cache(filename)
+    
+    if 'columns' not in cache:
+        cache['columns'] = tuple(get_dataframe(filename).columns)
+    
+    return cache['columns']
+
+def get_dataframe_head(filename, n=10):
+    """Return the first n rows of a stored dataset for previews
+    
+    The rows are converted to a pyarrow Table once, so st.dataframe can send
+    them to the frontend without another pandas-to-Arrow conversion.
+    """
+    cache = _dataset_cache(filename)
+    
+    if ('head', n) not in cache:
+        head = get_dataframe(filename).iloc[:n]
+        try:
+            cache[('head', n)] = pa.Table.from_pandas(head)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Mixed-type object columns; st.dataframe knows how to stringify these
+            cache[('head', n)] = head
+    
+    return cache[('head', n)]
+
+def get_dataset_overview(filename):
+    """Return the shape and column-list lines shown under dataset previews"""
+    cache = _dataset_cache(filename)
+    
+    if 'overview' not in cache:
+        df = get_dataframe(filename)
+        cache['overview'] = (
+            f"Shape: {df.shape[0]} rows, {df.shape[1]} columns",
+            f"Columns: {', '.join(map(str, df.columns))}"
+        )
+    
+    return cache['overview']
+
+def get_column_info(filename):
+    """Return a per-column dtype, non-null, null and unique count table for a stored dataset"""
+    cache = _dataset_cache(filename)
+    
+    if 'column_info' not in cache:
+        df = get_dataframe(filename)
+        cache['column_info'] = pd.DataFrame({
+            "Data Type": df.dtypes,
+            "Non-Null Values": df.count(),
+            "Null Values": df.isna().sum(),
+            "Unique Values": df.nunique()
+        })
+    
+    return cache['column_info']
+
+# Maps '_' and '-' to spaces in a single pass
+_NORMALIZE_TABLE = str.maketrans({'_': ' ', '-': ' '})
+
+def normalize_column_name(name):
+    """Normalize a column or field name for loose matching (case, '_' and '-' ignored)"""
+    return name.lower().translate(_NORMALIZE_TABLE)
+
+def get_normalized_columns(filename):
+    """Map normalized column names of a stored dataset to the first matching column"""
+    cache = _dataset_cache(filename)
+    
+    if 'normalized_columns' not in cache:
+        normalized = {}
+        for col in get_dataframe(filename).columns:
+            normalized.setdefault(normalize_column_name(col), col)
+        cache['normalized_columns'] = normalized
+    
+    return cache['normalized_columns']
+
+@st.cache_data(show_spinner=False, hash_funcs=DATAFRAME_HASH_FUNCS)
 def get_column_types(df):
     """Determine column types for a dataframe"""
     column_types = {}
+    remaining = []
     
-    for col in df.columns:
+    # Classify from the dtypes alone where possible
+    for col, dtype in df.dtypes.items():
         # Numeric
-        if pd.api.types.is_numeric_dtype(df[col]):
+        if pd.api.types.is_numeric_dtype(dtype):
             column_types[col] = 'numeric'
         # Datetime
-        elif pd.api.types.is_datetime64_any_dtype(df[col]):
+        elif pd.api.types.is_datetime64_any_dtype(dtype):
             column_types[col] = 'datetime'
         # Boolean
-        elif pd.api.types.is_bool_dtype(df[col]):
+        elif pd.api.types.is_bool_dtype(dtype):
             column_types[col] = 'boolean'
-        # Categorical/text - further analyze
+        # Categorical/text - further analyze below
         else:
-            # Check if it's likely a categorical variable
-            unique_count = df[col].nunique()
-            total_count = len(df)
-            
-            # If less than 10% of values are unique or fewer than 20 unique values, consider categorical
+            remaining.append(col)
+    
+    if remaining:
+        # One batched nunique over all the undecided columns
+        unique_counts = df[remaining].nunique()
+        total_count = len(df)
+        
+        # If less than 10% of values are unique or fewer than 20 unique values, consider categorical
+        for col in remaining:
+            unique_count = unique_counts[col]
             if unique_count < 20 or (unique_count / total_count) < 0.1:
                 column_types[col] = 'categorical'
             else:
                 column_types[col] = 'text'
     
-    return column_types
+    # Keep the dataframe's column order
+    return {col: column_types[col] for col in df.columns}
 
+@st.cache_data(show_spinner=False, hash_funcs=DATAFRAME_HASH_FUNCS)
 def get_column_stats(df):
     """Get statistics for each column in the dataframe"""
     stats = {}
     
+    # Basic stats for all columns, one batched reduction each
+    counts = df.count()
+    null_counts = df.isna().sum()
+    unique_counts = df.nunique()
+    
+    numeric_cols = [col for col, dtype in df.dtypes.items() if pd.api.types.is_numeric_dtype(dtype)]
+    datetime_cols = [col for col, dtype in df.dtypes.items() if pd.api.types.is_datetime64_any_dtype(dtype)]
+    
+    numeric_stats_cols = set(numeric_cols)
+    datetime_stats_cols = set(datetime_cols)
+    
+    if numeric_cols:
+        numeric = df[numeric_cols]
+        numeric_stats = {
+            'min': numeric.min(),
+            'max': numeric.max(),
+            'mean': numeric.mean(),
+            'median': numeric.median(),
+            'std': numeric.std()
+        }
+    if datetime_cols:
+        datetimes = df[datetime_cols]
+        datetime_mins = datetimes.min()
+        datetime_maxs = datetimes.max()
+    
     for col in df.columns:
-        col_stats = {}
-        
-        # Basic stats for all columns
-        col_stats['count'] = df[col].count()
-        col_stats['null_count'] = df[col].isna().sum()
-        col_stats['unique_count'] = df[col].nunique()
+        col_stats = {
+            'count': counts[col],
+            'null_count': null_counts[col],
+            'unique_count': unique_counts[col]
+        }
         
         # Type-specific stats
-        if pd.api.types.is_numeric_dtype(df[col]):
-            col_stats['min'] = df[col].min()
-            col_stats['max'] = df[col].max()
-            col_stats['mean'] = df[col].mean()
-            col_stats['median'] = df[col].median()
-            col_stats['std'] = df[col].std()
+        if col in numeric_stats_cols:
+            for name, values in numeric_stats.items():
+                col_stats[name] = values[col]
         
-        elif pd.api.types.is_datetime64_any_dtype(df[col]):
-            col_stats['min'] = df[col].min().strftime('%Y-%m-%d')
-            col_stats['max'] = df[col].max().strftime('%Y-%m-%d')
+        elif col in datetime_stats_cols:
+            col_stats['min'] = datetime_mins[col].strftime('%Y-%m-%d')
+            col_stats['max'] = datetime_maxs[col].strftime('%Y-%m-%d')
             
         elif not pd.api.types.is_bool_dtype(df[col]):  # Text or categorical
             if col_stats['unique_count'] <= 10:  # Show value counts for categorical variables
@@ -98,6 +450,7 @@ def get_column_stats(df):
     
     return stats
 
+@st.cache_data(show_spinner=False, hash_funcs=DATAFRAME_HASH_FUNCS)
 def detect_time_series(df):
     """Detect if the dataframe contains time series data"""
     
@@ -105,13 +458,8 @@ def detect_time_series(df):
     datetime_cols = [col for col in df.columns if pd.api.types.is_datetime64_any_dtype(df[col])]
     
     if not datetime_cols:
-        # Check if any columns can be converted to datetime
-        for col in df.columns:
-            try:
-                pd.to_datetime(df[col])
-                datetime_cols.append(col)
-            except:
-                pass
+        # Check if any text columns look like dates
+        datetime_cols = [col for col in df.columns if looks_like_datetime(df[col])]
     
     # Check if we have both datetime and numeric columns
     numeric_cols = [col for col in df.columns if pd.api.types.is_numeric_dtype(df[col])]
@@ -1,145 +1,161 @@
 import pandas as pd
-import random
+import numpy as np
 import datetime
-import json
+import functools
+import hashlib
+import os
+import string
+import tempfile
+import time
+import zlib
+from types import MappingProxyType
+
+def _freeze(value):
+    """Recursively turn dicts into read-only mappings and lists into tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+# Static integration catalog, built once at import and shared read-only by every session
+_INTEGRATIONS = _freeze([
+    {
+        'id': 'quickbooks',
+        'name': 'QuickBooks',
+        'description': 'Import financial data from QuickBooks accounting software',
+        'icon': 'money-bill-wave',
+        'auth_type': 'oauth',
+        'required_fields': ['oauth_token'],
+        'setup_instructions': 'Connect to QuickBooks to import your financial data for visualization.',
+        'config_fields': [
+            {
+                'id': 'company_id',
+                'label': 'Company ID',
+                'type': 'text',
+                'placeholder': 'Enter your QuickBooks Company ID'
+            },
+            {
+                'id': 'date_range',
+                'label': 'Default date range',
+                'type': 'select',
+                'options': ['Last month', 'Last quarter', 'Last year', 'All time']
+            }
+        ]
+    },
+    {
+        'id': 'shopify',
+        'name': 'Shopify',
+        'description': 'Import e-commerce data from your Shopify store',
+        'icon': 'shopping-cart',
+        'auth_type': 'api_key',
+        'required_fields': ['api_key', 'shop_name'],
+        'setup_instructions': 'Connect to Shopify to import your sales, product, and customer data.',
+        'config_fields': [
+            {
+                'id': 'shop_name',
+                'label': 'Shop Name',
+                'type': 'text',
+                'placeholder': 'your-shop-name.myshopify.com'
+            },
+            {
+                'id': 'data_types',
+                'label': 'Data to import',
+                'type': 'select',
+                'options': ['Orders only', 'Orders and customers', 'All data']
+            }
+        ]
+    },
+    {
+        'id': 'google_analytics',
+        'name': 'Google Analytics',
+        'description': 'Import website analytics data from Google Analytics',
+        'icon': 'chart-line',
+        'auth_type': 'oauth',
+        'required_fields': ['oauth_token'],
+        'setup_instructions': 'Connect to Google Analytics to import your website traffic and user behavior data.',
+        'config_fields': [
+            {
+                'id': 'view_id',
+                'label': 'View ID',
+                'type': 'text',
+                'placeholder': 'Enter your Google Analytics View ID'
+            },
+            {
+                'id': 'metrics',
+                'label': 'Default metrics',
+                'type': 'select',
+                'options': ['Page views', 'Sessions', 'Users', 'All basic metrics']
+            }
+        ]
+    },
+    {
+        'id': 'salesforce',
+        'name': 'Salesforce',
+        'description': 'Import CRM data from Salesforce',
+        'icon': 'cloud',
+        'auth_type': 'oauth',
+        'required_fields': ['oauth_token'],
+        'setup_instructions': 'Connect to Salesforce to import your customer, opportunity, and sales data.',
+        'config_fields': [
+            {
+                'id': 'instance_url',
+                'label': 'Salesforce Instance URL',
+                'type': 'text',
+                'placeholder': 'https://yourinstance.salesforce.com'
+            }
+        ]
+    },
+    {
+        'id': 'mailchimp',
+        'name': 'Mailchimp',
+        'description': 'Import email marketing data from Mailchimp',
+        'icon': 'envelope',
+        'auth_type': 'api_key',
+        'required_fields': ['api_key'],
+        'setup_instructions': 'Connect to Mailchimp to import your email campaign and subscriber data.',
+        'config_fields': [
+            {
+                'id': 'list_id',
+                'label': 'Default List/Audience ID',
+                'type': 'text',
+                'placeholder': 'Enter your main Mailchimp list ID'
+            }
+        ]
+    },
+    {
+        'id': 'google_sheets',
+        'name': 'Google Sheets',
+        'description': 'Import data from Google Sheets spreadsheets',
+        'icon': 'table',
+        'auth_type': 'oauth',
+        'required_fields': ['oauth_token'],
+        'setup_instructions': 'Connect to Google Sheets to import data from your spreadsheets.',
+        'config_fields': [
+            {
+                'id': 'sheet_id',
+                'label': 'Spreadsheet ID',
+                'type': 'text',
+                'placeholder': 'Enter the ID from your spreadsheet URL'
+            },
+            {
+                'id': 'sheet_range',
+                'label': 'Cell Range (optional)',
+                'type': 'text',
+                'placeholder': 'e.g., Sheet1!A1:E100'
+            }
+        ]
+    }
+])
 
 def get_available_integrations():
     """
     Get list of available external tool integrations
     
     Returns:
-        list: List of integration objects
+        tuple: Read-only integration objects
     """
-    integrations = [
-        {
-            'id': 'quickbooks',
-            'name': 'QuickBooks',
-            'description': 'Import financial data from QuickBooks accounting software',
-            'icon': 'money-bill-wave',
-            'auth_type': 'oauth',
-            'required_fields': ['oauth_token'],
-            'setup_instructions': 'Connect to QuickBooks to import your financial data for visualization.',
-            'config_fields': [
-                {
-                    'id': 'company_id',
-                    'label': 'Company ID',
-                    'type': 'text',
-                    'placeholder': 'Enter your QuickBooks Company ID'
-                },
-                {
-                    'id': 'date_range',
-                    'label': 'Default date range',
-                    'type': 'select',
-                    'options': ['Last month', 'Last quarter', 'Last year', 'All time']
-                }
-            ]
-        },
-        {
-            'id': 'shopify',
-            'name': 'Shopify',
-            'description': 'Import e-commerce data from your Shopify store',
-            'icon': 'shopping-cart',
-            'auth_type': 'api_key',
-            'required_fields': ['api_key', 'shop_name'],
-            'setup_instructions': 'Connect to Shopify to import your sales, product, and customer data.',
-            'config_fields': [
-                {
-                    'id': 'shop_name',
-                    'label': 'Shop Name',
-                    'type': 'text',
-                    'placeholder': 'your-shop-name.myshopify.com'
-                },
-                {
-                    'id': 'data_types',
-                    'label': 'Data to import',
-                    'type': 'select',
-                    'options': ['Orders only', 'Orders and customers', 'All data']
-                }
-            ]
-        },
-        {
-            'id': 'google_analytics',
-            'name': 'Google Analytics',
-            'description': 'Import website analytics data from Google Analytics',
-            'icon': 'chart-line',
-            'auth_type': 'oauth',
-            'required_fields': ['oauth_token'],
-            'setup_instructions': 'Connect to Google Analytics to import your website traffic and user behavior data.',
-            'config_fields': [
-                {
-                    'id': 'view_id',
-                    'label': 'View ID',
-                    'type': 'text',
-                    'placeholder': 'Enter your Google Analytics View ID'
-                },
-                {
-                    'id': 'metrics',
-                    'label': 'Default metrics',
-                    'type': 'select',
-                    'options': ['Page views', 'Sessions', 'Users', 'All basic metrics']
-                }
-            ]
-        },
-        {
-            'id': 'salesforce',
-            'name': 'Salesforce',
-            'description': 'Import CRM data from Salesforce',
-            'icon': 'cloud',
-            'auth_type': 'oauth',
-            'required_fields': ['oauth_token'],
-            'setup_instructions': 'Connect to Salesforce to import your customer, opportunity, and sales data.',
-            'config_fields': [
-                {
-                    'id': 'instance_url',
-                    'label': 'Salesforce Instance URL',
-                    'type': 'text',
-                    'placeholder': 'https://yourinstance.salesforce.com'
-                }
-            ]
-        },
-        {
-            'id': 'mailchimp',
-            'name': 'Mailchimp',
-            'description': 'Import email marketing data from Mailchimp',
-            'icon': 'envelope',
-            'auth_type': 'api_key',
-            'required_fields': ['api_key'],
-            'setup_instructions': 'Connect to Mailchimp to import your email campaign and subscriber data.',
-            'config_fields': [
-                {
-                    'id': 'list_id',
-                    'label': 'Default List/Audience ID',
-                    'type': 'text',
-                    'placeholder': 'Enter your main Mailchimp list ID'
-                }
-            ]
-        },
-        {
-            'id': 'google_sheets',
-            'name': 'Google Sheets',
-            'description': 'Import data from Google Sheets spreadsheets',
-            'icon': 'table',
-            'auth_type': 'oauth',
-            'required_fields': ['oauth_token'],
-            'setup_instructions': 'Connect to Google Sheets to import data from your spreadsheets.',
-            'config_fields': [
-                {
-                    'id': 'sheet_id',
-                    'label': 'Spreadsheet ID',
-                    'type': 'text',
-                    'placeholder': 'Enter the ID from your spreadsheet URL'
-                },
-                {
-                    'id': 'sheet_range',
-                    'label': 'Cell Range (optional)',
-                    'type': 'text',
-                    'placeholder': 'e.g., Sheet1!A1:E100'
-                }
-            ]
-        }
-    ]
-    
-    return integrations
+    return _INTEGRATIONS
 
 def setup_integration(integration_id, auth_fields):
     """
@@ -172,326 +188,353 @@ def get_integration_data(integration_id, connection_info, data_type=None, start_
         end_date (datetime, optional): End date for the data range
         
     Returns:
-        dict: Data from the integration or error message
+        dict: Filename and a DataFrame of records from the integration
     """
     # This would be implemented to actually fetch data from the service
     # For the demo, we'll generate mock data based on the integration and data type
     
     # Set default dates if not provided
     if not start_date:
-        start_date = datetime.datetime.now() - datetime.timedelta(days=30)
+        start_date = datetime.date.today() - datetime.timedelta(days=30)
     if not end_date:
-        end_date = datetime.datetime.now()
+        end_date = datetime.date.today()
     
-    # Generate date range
-    date_range = pd.date_range(start=start_date, end=end_date, freq='D')
-    
-    # QuickBooks data
-    if integration_id == 'quickbooks':
-        if data_type == "Profit & Loss":
-            # Generate P&L statement data
-            data = []
-            categories = ["Sales", "Cost of Goods Sold", "Operating Expenses", "Marketing", "Rent", "Utilities", "Salaries"]
-            
-            for date in date_range:
-                for category in categories:
-                    # Generate sensible values based on category
-                    if category == "Sales":
-                        amount = random.uniform(1000, 5000)
-                    elif category == "Cost of Goods Sold":
-                        amount = random.uniform(500, 2000)
-                    else:
-                        amount = random.uniform(100, 1000)
-                    
-                    data.append({
-                        "Date": date.strftime("%Y-%m-%d"),
-                        "Category": category,
-                        "Amount": round(amount, 2),
-                        "Department": random.choice(["Sales", "Marketing", "Operations", "Admin"])
-                    })
-            
-            return {
-                'filename': 'quickbooks_profit_loss.csv',
-                'data': data
-            }
-            
-        elif data_type == "Balance Sheet":
-            # Generate balance sheet data
-            data = []
-            asset_categories = ["Cash", "Accounts Receivable", "Inventory", "Equipment", "Real Estate"]
-            liability_categories = ["Accounts Payable", "Short-term Loans", "Long-term Debt", "Taxes Payable"]
-            equity_categories = ["Owner's Equity", "Retained Earnings"]
-            
-            for date in date_range[::7]:  # Weekly snapshots
-                for category in asset_categories + liability_categories + equity_categories:
-                    # Generate type based on category
-                    if category in asset_categories:
-                        type = "Asset"
-                        amount = random.uniform(5000, 100000)
-                    elif category in liability_categories:
-                        type = "Liability"
-                        amount = random.uniform(1000, 50000)
-                    else:
-                        type = "Equity"
-                        amount = random.uniform(10000, 200000)
-                    
-                    data.append({
-                        "Date": date.strftime("%Y-%m-%d"),
-                        "Category": category,
-                        "Type": type,
-                        "Amount": round(amount, 2)
-                    })
-            
-            return {
-                'filename': 'quickbooks_balance_sheet.csv',
-                'data': data
-            }
-            
-        elif data_type == "Invoices":
-            # Generate invoice data
-            data = []
-            customers = ["Customer A", "Customer B", "Customer C", "Customer D", "Customer E"]
-            statuses = ["Paid", "Unpaid", "Overdue", "Partially Paid"]
-            
-            for i in range(100):
-                invoice_date = start_date + datetime.timedelta(days=random.randint(0, (end_date - start_date).days))
-                due_date = invoice_date + datetime.timedelta(days=30)
-                amount = random.uniform(100, 5000)
-                paid_amount = amount if random.random() > 0.3 else random.uniform(0, amount)
-                
-                data.append({
-                    "Invoice_Number": f"INV-{1000+i}",
-                    "Customer": random.choice(customers),
-                    "Invoice_Date": invoice_date.strftime("%Y-%m-%d"),
-                    "Due_Date": due_date.strftime("%Y-%m-%d"),
-                    "Amount": round(amount, 2),
-                    "Paid_Amount": round(paid_amount, 2),
-                    "Status": "Paid" if paid_amount >= amount else "Unpaid" if paid_amount == 0 else "Partially Paid",
-                    "Days_Outstanding": (datetime.datetime.now() - invoice_date).days
-                })
-            
-            return {
-                'filename': 'quickbooks_invoices.csv',
-                'data': data
-            }
-        
-        else:
-            # Default financial data
-            data = []
-            categories = ["Revenue", "Expenses", "Profit"]
-            
-            for date in date_range:
-                revenue = random.uniform(1000, 5000)
-                expenses = random.uniform(500, 3000)
-                profit = revenue - expenses
-                
-                for category in categories:
-                    value = revenue if category == "Revenue" else expenses if category == "Expenses" else profit
-                    data.append({
-                        "Date": date.strftime("%Y-%m-%d"),
-                        "Category": category,
-                        "Amount": round(value, 2)
-                    })
-            
-            return {
-                'filename': 'quickbooks_financial_data.csv',
-                'data': data
-            }
+    # Mock data only depends on the calendar days, so normalize them for the cache key
+    if isinstance(start_date, datetime.datetime):
+        start_date = start_date.date()
+    if isinstance(end_date, datetime.datetime):
+        end_date = end_date.date()
     
-    # Shopify data
-    elif integration_id == 'shopify':
-        if data_type == "Orders":
-            # Generate order data
-            data = []
-            products = ["Product A", "Product B", "Product C", "Product D", "Product E"]
-            payment_methods = ["Credit Card", "PayPal", "Shop Pay", "Apple Pay", "Google Pay"]
-            
-            for i in range(200):
-                order_date = start_date + datetime.timedelta(days=random.randint(0, (end_date - start_date).days))
-                num_items = random.randint(1, 5)
-                item_price = random.uniform(10, 100)
-                total = num_items * item_price
-                discount = total * random.uniform(0, 0.2) if random.random() > 0.7 else 0
-                
-                data.append({
-                    "Order_ID": f"ORD-{10000+i}",
-                    "Date": order_date.strftime("%Y-%m-%d"),
-                    "Customer_Email": f"customer{i}@example.com",
-                    "Product": random.choice(products),
-                    "Quantity": num_items,
-                    "Price_Per_Item": round(item_price, 2),
-                    "Discount": round(discount, 2),
-                    "Total": round(total - discount, 2),
-                    "Payment_Method": random.choice(payment_methods),
-                    "Status": random.choice(["Fulfilled", "Unfulfilled", "Cancelled"]) if random.random() > 0.8 else "Fulfilled"
-                })
-            
-            return {
-                'filename': 'shopify_orders.csv',
-                'data': data
-            }
-            
-        elif data_type == "Products":
-            # Generate product data
-            data = []
-            categories = ["Clothing", "Electronics", "Home Goods", "Beauty", "Food"]
-            
-            for i in range(50):
-                data.append({
-                    "Product_ID": f"PROD-{1000+i}",
-                    "Product_Name": f"Product {chr(65+i%26)}{i//26}",
-                    "Category": random.choice(categories),
-                    "Price": round(random.uniform(10, 200), 2),
-                    "Cost": round(random.uniform(5, 100), 2),
-                    "Inventory_Quantity": random.randint(0, 100),
-                    "Published": random.choice([True, False]) if random.random() > 0.9 else True
-                })
-            
-            return {
-                'filename': 'shopify_products.csv',
-                'data': data
-            }
-            
-        elif data_type == "Customers":
-            # Generate customer data
-            data = []
-            locations = ["New York", "Los Angeles", "Chicago", "Houston", "Phoenix", "Philadelphia", "San Antonio", "San Diego"]
-            
-            for i in range(100):
-                signup_date = start_date + datetime.timedelta(days=random.randint(-365, (end_date - start_date).days))
-                orders_count = random.randint(0, 20)
-                
-                data.append({
-                    "Customer_ID": f"CUST-{1000+i}",
-                    "Email": f"customer{i}@example.com",
-                    "First_Name": f"First{i}",
-                    "Last_Name": f"Last{i}",
-                    "City": random.choice(locations),
-                    "Signup_Date": signup_date.strftime("%Y-%m-%d"),
-                    "Orders_Count": orders_count,
-                    "Total_Spent": round(orders_count * random.uniform(50, 200), 2),
-                    "Last_Order_Date": (signup_date + datetime.timedelta(days=random.randint(0, 365))).strftime("%Y-%m-%d") if orders_count > 0 else None
-                })
-            
-            return {
-                'filename': 'shopify_customers.csv',
-                'data': data
-            }
-        
-        else:
-            # Default to sales data
-            data = []
-            
-            for date in date_range:
-                daily_orders = random.randint(5, 30)
-                avg_order_value = random.uniform(50, 200)
-                
-                data.append({
-                    "Date": date.strftime("%Y-%m-%d"),
-                    "Orders": daily_orders,
-                    "Sales": round(daily_orders * avg_order_value, 2),
-                    "Customers": random.randint(daily_orders, daily_orders + 10),
-                    "Refunds": round(daily_orders * random.uniform(0, 0.1)),
-                    "Discount_Amount": round(daily_orders * avg_order_value * random.uniform(0, 0.2), 2)
-                })
-            
-            return {
-                'filename': 'shopify_sales_data.csv',
-                'data': data
-            }
+    # Today's date is part of the key because some generators (invoice ages) depend on it
+    cached = _generate_integration_data(
+        integration_id, data_type, start_date.isoformat(), end_date.isoformat(), datetime.date.today().isoformat()
+    )
     
-    # Google Analytics data
-    elif integration_id == 'google_analytics':
-        if data_type == "Website Traffic":
-            # Generate website traffic data
-            data = []
-            
-            for date in date_range:
-                traffic_multiplier = 1 + 0.5 * math.sin(date.day_of_year * 0.1)  # Create some seasonality
-                
-                data.append({
-                    "Date": date.strftime("%Y-%m-%d"),
-                    "Sessions": int(random.uniform(500, 2000) * traffic_multiplier),
-                    "Users": int(random.uniform(400, 1500) * traffic_multiplier),
-                    "Pageviews": int(random.uniform(1000, 5000) * traffic_multiplier),
-                    "Bounce_Rate": round(random.uniform(0.2, 0.6), 2),
-                    "Avg_Session_Duration": round(random.uniform(60, 360), 2),
-                    "Pages_Per_Session": round(random.uniform(1.5, 4.5), 2)
-                })
-            
-            return {
-                'filename': 'google_analytics_traffic.csv',
-                'data': data
-            }
-            
-        elif data_type == "Referrers":
-            # Generate referral source data
-            data = []
-            referrers = ["Google", "Facebook", "Twitter", "Instagram", "LinkedIn", "Direct", "Email", "Other"]
-            
-            for date in date_range[::3]:  # Every third day
-                for referrer in referrers:
-                    sessions = random.randint(10, 500)
-                    bounce_rate = random.uniform(0.2, 0.8)
-                    
-                    data.append({
-                        "Date": date.strftime("%Y-%m-%d"),
-                        "Source": referrer,
-                        "Sessions": sessions,
-                        "New_Users": int(sessions * random.uniform(0.5, 0.9)),
-                        "Bounce_Rate": round(bounce_rate, 2),
-                        "Avg_Session_Duration": round(random.uniform(30, 300), 2),
-                        "Conversions": int(sessions * (1 - bounce_rate) * random.uniform(0.01, 0.2))
-                    })
-            
-            return {
-                'filename': 'google_analytics_referrers.csv',
-                'data': data
-            }
-        
-        else:
-            # Default to page performance
-            data = []
-            pages = ["/home", "/products", "/about", "/contact", "/blog", "/cart", "/checkout"]
-            
-            for page in pages:
-                views = random.randint(100, 10000)
-                avg_time = random.uniform(10, 180)
-                
-                data.append({
-                    "Page_Path": page,
-                    "Pageviews": views,
-                    "Unique_Pageviews": int(views * random.uniform(0.7, 0.95)),
-                    "Avg_Time_on_Page": round(avg_time, 2),
-                    "Entrances": int(views * random.uniform(0.1, 0.5)),
-                    "Bounce_Rate": round(random.uniform(0.1, 0.8), 2),
-                    "Exit_Rate": round(random.uniform(0.1, 0.7), 2)
-                })
-            
-            return {
-                'filename': 'google_analytics_pages.csv',
-                'data': data
-            }
+    # The cached frame is shared by every caller and session, so each caller gets its own copy
+    return {**cached, 'data': cached['data'].copy()}
+
+def _id_column(prefix, start, n, suffix=""):
+    """Sequential string IDs such as INV-1000, INV-1001, ... built in one vectorized pass"""
+    ids = np.char.add(prefix, np.arange(start, start + n).astype(str))
+    return np.char.add(ids, suffix) if suffix else ids
+
+def _quickbooks_profit_loss(rng, date_range, date_strs):
+    """P&L statement: one row per day and category, drawn in one batch"""
+    categories = ["Sales", "Cost of Goods Sold", "Operating Expenses", "Marketing", "Rent", "Utilities", "Salaries"]
+    lows = np.array([1000, 500, 100, 100, 100, 100, 100])
+    highs = np.array([5000, 2000, 1000, 1000, 1000, 1000, 1000])
     
-    # Default fallback for any other integration
-    else:
-        # Generate generic time series data
-        data = []
-        metrics = ["Metric A", "Metric B", "Metric C"]
-        
-        for date in date_range:
-            for metric in metrics:
-                value = random.uniform(100, 1000)
-                data.append({
-                    "Date": date.strftime("%Y-%m-%d"),
-                    "Metric": metric,
-                    "Value": round(value, 2)
-                })
-        
-        return {
-            'filename': f'{integration_id}_data.csv',
-            'data': data
-        }
+    amounts = rng.uniform(lows, highs, size=(len(date_range), len(categories)))
+    return pd.DataFrame({
+        "Date": np.repeat(date_strs, len(categories)),
+        "Category": np.tile(categories, len(date_range)),
+        "Amount": amounts.ravel().round(2),
+        "Department": rng.choice(["Sales", "Marketing", "Operations", "Admin"], amounts.size)
+    })
+
+# Balance sheet category -> account type, and the amount range drawn for each type
+_BS_TYPE = {
+    **{category: "Asset" for category in ["Cash", "Accounts Receivable", "Inventory", "Equipment", "Real Estate"]},
+    **{category: "Liability" for category in ["Accounts Payable", "Short-term Loans", "Long-term Debt", "Taxes Payable"]},
+    **{category: "Equity" for category in ["Owner's Equity", "Retained Earnings"]}
+}
+_BS_RANGE = {"Asset": (5000, 100000), "Liability": (1000, 50000), "Equity": (10000, 200000)}
+
+def _quickbooks_balance_sheet(rng, date_range, date_strs):
+    """Weekly balance sheet snapshots"""
+    dates = date_strs[::7]  # Weekly snapshots
+    categories = list(_BS_TYPE)
+    types = [_BS_TYPE[category] for category in categories]
+    lows, highs = np.array([_BS_RANGE[t] for t in types]).T
+    
+    amounts = rng.uniform(lows, highs, size=(len(dates), len(categories)))
+    return pd.DataFrame({
+        "Date": np.repeat(dates, len(categories)),
+        "Category": np.tile(categories, len(dates)),
+        "Type": np.tile(types, len(dates)),
+        "Amount": amounts.ravel().round(2)
+    })
+
+def _quickbooks_invoices(rng, date_range, date_strs):
+    """Invoices with payment status"""
+    customers = ["Customer A", "Customer B", "Customer C", "Customer D", "Customer E"]
+    
+    n = 100
+    offsets = rng.integers(0, len(date_range), n)
+    invoice_dates = date_range[offsets]
+    amounts = rng.uniform(100, 5000, n)
+    paid_amounts = np.where(rng.random(n) > 0.3, amounts, rng.uniform(0, amounts))
+    
+    return pd.DataFrame({
+        "Invoice_Number": _id_column("INV-", 1000, n),
+        "Customer": rng.choice(customers, n),
+        "Invoice_Date": date_strs[offsets],
+        "Due_Date": (invoice_dates + pd.Timedelta(days=30)).strftime("%Y-%m-%d"),
+        "Amount": amounts.round(2),
+        "Paid_Amount": paid_amounts.round(2),
+        "Status": np.where(paid_amounts >= amounts, "Paid", np.where(paid_amounts == 0, "Unpaid", "Partially Paid")),
+        "Days_Outstanding": (pd.Timestamp(datetime.date.today()) - invoice_dates).days
+    })
+
+def _quickbooks_financial_data(rng, date_range, date_strs):
+    """Default QuickBooks data: daily revenue, expenses and profit"""
+    categories = ["Revenue", "Expenses", "Profit"]
+    
+    revenue = rng.uniform(1000, 5000, len(date_range))
+    expenses = rng.uniform(500, 3000, len(date_range))
+    amounts = np.column_stack([revenue, expenses, revenue - expenses])
+    
+    return pd.DataFrame({
+        "Date": np.repeat(date_strs, len(categories)),
+        "Category": np.tile(categories, len(date_range)),
+        "Amount": np.round(amounts.ravel(), 2)
+    })
 
-# Helper for Google Analytics data generation
-import math
+def _shopify_orders(rng, date_range, date_strs):
+    """Individual store orders"""
+    products = ["Product A", "Product B", "Product C", "Product D", "Product E"]
+    payment_methods = ["Credit Card", "PayPal", "Shop Pay", "Apple Pay", "Google Pay"]
+    
+    n = 200
+    quantities = rng.integers(1, 6, n)
+    item_prices = rng.uniform(10, 100, n)
+    totals = quantities * item_prices
+    discounts = np.where(rng.random(n) > 0.7, totals * rng.uniform(0, 0.2, n), 0)
+    statuses = np.where(rng.random(n) > 0.8, rng.choice(["Fulfilled", "Unfulfilled", "Cancelled"], n), "Fulfilled")
+    
+    return pd.DataFrame({
+        "Order_ID": _id_column("ORD-", 10000, n),
+        "Date": date_strs[rng.integers(0, len(date_range), n)],
+        "Customer_Email": _id_column("customer", 0, n, "@example.com"),
+        "Product": rng.choice(products, n),
+        "Quantity": quantities,
+        "Price_Per_Item": item_prices.round(2),
+        "Discount": discounts.round(2),
+        "Total": (totals - discounts).round(2),
+        "Payment_Method": rng.choice(payment_methods, n),
+        "Status": statuses
+    })
+
+def _shopify_products(rng, date_range, date_strs):
+    """Product catalog with pricing and inventory"""
+    categories = ["Clothing", "Electronics", "Home Goods", "Beauty", "Food"]
+    
+    n = 50
+    ids = np.arange(n)
+    letters = np.array(list(string.ascii_uppercase))
+    
+    return pd.DataFrame({
+        "Product_ID": _id_column("PROD-", 1000, n),
+        "Product_Name": np.char.add(np.char.add("Product ", letters[ids % 26]), (ids // 26).astype(str)),
+        "Category": rng.choice(categories, n),
+        "Price": np.round(rng.uniform(10, 200, n), 2),
+        "Cost": np.round(rng.uniform(5, 100, n), 2),
+        "Inventory_Quantity": rng.integers(0, 101, n),
+        "Published": np.where(rng.random(n) > 0.9, rng.random(n) < 0.5, True)
+    })
+
+def _shopify_customers(rng, date_range, date_strs):
+    """Customer accounts and their order history"""
+    locations = ["New York", "Los Angeles", "Chicago", "Houston", "Phoenix", "Philadelphia", "San Antonio", "San Diego"]
+    
+    n = 100
+    signup_dates = date_range[0] + pd.to_timedelta(rng.integers(-365, len(date_range), n), unit="D")
+    last_order_dates = signup_dates + pd.to_timedelta(rng.integers(0, 366, n), unit="D")
+    orders_count = rng.integers(0, 21, n)
+    
+    return pd.DataFrame({
+        "Customer_ID": _id_column("CUST-", 1000, n),
+        "Email": _id_column("customer", 0, n, "@example.com"),
+        "First_Name": _id_column("First", 0, n),
+        "Last_Name": _id_column("Last", 0, n),
+        "City": rng.choice(locations, n),
+        "Signup_Date": signup_dates.strftime("%Y-%m-%d"),
+        "Orders_Count": orders_count,
+        "Total_Spent": np.round(orders_count * rng.uniform(50, 200, n), 2),
+        "Last_Order_Date": np.where(orders_count > 0, last_order_dates.strftime("%Y-%m-%d"), None)
+    })
+
+def _shopify_sales_data(rng, date_range, date_strs):
+    """Default Shopify data: daily sales totals"""
+    n = len(date_range)
+    daily_orders = rng.integers(5, 31, n)
+    gross_sales = daily_orders * rng.uniform(50, 200, n)
+    
+    return pd.DataFrame({
+        "Date": date_strs,
+        "Orders": daily_orders,
+        "Sales": np.round(gross_sales, 2),
+        "Customers": daily_orders + rng.integers(0, 11, n),
+        "Refunds": np.round(daily_orders * rng.uniform(0, 0.1, n)).astype(int),
+        "Discount_Amount": np.round(gross_sales * rng.uniform(0, 0.2, n), 2)
+    })
+
+def _google_analytics_traffic(rng, date_range, date_strs):
+    """Daily website traffic with some yearly seasonality"""
+    n = len(date_range)
+    traffic_multiplier = 1 + 0.5 * np.sin(date_range.dayofyear.to_numpy() * 0.1)
+    return pd.DataFrame({
+        "Date": date_strs,
+        "Sessions": (rng.uniform(500, 2000, n) * traffic_multiplier).astype(int),
+        "Users": (rng.uniform(400, 1500, n) * traffic_multiplier).astype(int),
+        "Pageviews": (rng.uniform(1000, 5000, n) * traffic_multiplier).astype(int),
+        "Bounce_Rate": rng.uniform(0.2, 0.6, n).round(2),
+        "Avg_Session_Duration": rng.uniform(60, 360, n).round(2),
+        "Pages_Per_Session": rng.uniform(1.5, 4.5, n).round(2)
+    })
+
+def _google_analytics_referrers(rng, date_range, date_strs):
+    """Sessions by referral source, every third day"""
+    referrers = ["Google", "Facebook", "Twitter", "Instagram", "LinkedIn", "Direct", "Email", "Other"]
+    dates = date_strs[::3]  # Every third day
+    
+    n = len(dates) * len(referrers)
+    sessions = rng.integers(10, 501, n)
+    bounce_rates = rng.uniform(0.2, 0.8, n)
+    
+    return pd.DataFrame({
+        "Date": np.repeat(dates, len(referrers)),
+        "Source": np.tile(referrers, len(dates)),
+        "Sessions": sessions,
+        "New_Users": (sessions * rng.uniform(0.5, 0.9, n)).astype(int),
+        "Bounce_Rate": bounce_rates.round(2),
+        "Avg_Session_Duration": rng.uniform(30, 300, n).round(2),
+        "Conversions": (sessions * (1 - bounce_rates) * rng.uniform(0.01, 0.2, n)).astype(int)
+    })
+
+def _google_analytics_pages(rng, date_range, date_strs):
+    """Default Google Analytics data: page performance"""
+    pages = ["/home", "/products", "/about", "/contact", "/blog", "/cart", "/checkout"]
+    
+    n = len(pages)
+    views = rng.integers(100, 10001, n)
+    
+    return pd.DataFrame({
+        "Page_Path": pages,
+        "Pageviews": views,
+        "Unique_Pageviews": (views * rng.uniform(0.7, 0.95, n)).astype(int),
+        "Avg_Time_on_Page": np.round(rng.uniform(10, 180, n), 2),
+        "Entrances": (views * rng.uniform(0.1, 0.5, n)).astype(int),
+        "Bounce_Rate": np.round(rng.uniform(0.1, 0.8, n), 2),
+        "Exit_Rate": np.round(rng.uniform(0.1, 0.7, n), 2)
+    })
+
+def _generic_metrics(rng, date_range, date_strs):
+    """Fallback for any other integration: generic daily metrics"""
+    metrics = ["Metric A", "Metric B", "Metric C"]
+    
+    values = rng.uniform(100, 1000, len(date_range) * len(metrics))
+    return pd.DataFrame({
+        "Date": np.repeat(date_strs, len(metrics)),
+        "Metric": np.tile(metrics, len(date_range)),
+        "Value": np.round(values, 2)
+    })
+
+# (integration_id, data_type) -> (filename, generator)
+_GENERATORS = {
+    ('quickbooks', "Profit & Loss"): ('quickbooks_profit_loss.csv', _quickbooks_profit_loss),
+    ('quickbooks', "Balance Sheet"): ('quickbooks_balance_sheet.csv', _quickbooks_balance_sheet),
+    ('quickbooks', "Invoices"): ('quickbooks_invoices.csv', _quickbooks_invoices),
+    ('shopify', "Orders"): ('shopify_orders.csv', _shopify_orders),
+    ('shopify', "Products"): ('shopify_products.csv', _shopify_products),
+    ('shopify', "Customers"): ('shopify_customers.csv', _shopify_customers),
+    ('google_analytics', "Website Traffic"): ('google_analytics_traffic.csv', _google_analytics_traffic),
+    ('google_analytics', "Referrers"): ('google_analytics_referrers.csv', _google_analytics_referrers)
+}
+
+# integration_id -> (filename, generator) used for any other data type
+_DEFAULT_GENERATORS = {
+    'quickbooks': ('quickbooks_financial_data.csv', _quickbooks_financial_data),
+    'shopify': ('shopify_sales_data.csv', _shopify_sales_data),
+    'google_analytics': ('google_analytics_pages.csv', _google_analytics_pages)
+}
+
+# Generated mock data is also kept on disk so it survives app restarts: under
+# $DATAVIZSME_CACHE_DIR when set, otherwise in the system temp directory
+INTEGRATION_CACHE_DIR = os.path.join(
+    os.environ.get("DATAVIZSME_CACHE_DIR") or os.path.join(tempfile.gettempdir(), "datavizsme"),
+    "integrations"
+)
+
+# The disk cache keeps at most this many files, dropping any not used for this many days
+INTEGRATION_CACHE_MAX_FILES = 256
+INTEGRATION_CACHE_MAX_AGE_DAYS = 7
+
+# Generators whose output depends on today's date (invoice ages), so their disk
+# cache entries are keyed by day; every other generator reuses entries across days
+_TODAY_DEPENDENT_GENERATORS = frozenset({_quickbooks_invoices})
+
+def _prune_integration_cache():
+    """Delete disk cache files past the age limit, then the least recently used beyond the file limit"""
+    cutoff = time.time() - INTEGRATION_CACHE_MAX_AGE_DAYS * 86400
+    entries = []
+    for root, _, names in os.walk(INTEGRATION_CACHE_DIR):
+        for name in names:
+            path = os.path.join(root, name)
+            try:
+                entries.append((os.path.getmtime(path), name.endswith(".parquet"), path))
+            except OSError:
+                pass  # Removed by another session in the meantime
+    
+    # Newest first; leftover temp files (from interrupted writes) only go once they are stale
+    entries.sort(reverse=True)
+    kept = 0
+    for mtime, is_entry, path in entries:
+        if is_entry:
+            kept += 1
+        if mtime < cutoff or (is_entry and kept > INTEGRATION_CACHE_MAX_FILES):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+@functools.lru_cache(maxsize=128)
+def _generate_integration_data(integration_id, data_type, start_iso, end_iso, today_iso):
+    """Generate mock integration data, seeded from the arguments so repeat calls match"""
+    filename, generator = (
+        _GENERATORS.get((integration_id, data_type))
+        or _DEFAULT_GENERATORS.get(integration_id)
+        or (f'{integration_id}_data.csv', _generic_metrics)
+    )
+    
+    key_parts = [integration_id, str(data_type), start_iso, end_iso]
+    if generator in _TODAY_DEPENDENT_GENERATORS:
+        key_parts.append(today_iso)
+    key = hashlib.sha1("|".join(key_parts).encode()).hexdigest()
+    cache_path = os.path.join(INTEGRATION_CACHE_DIR, integration_id, f"{key}.parquet")
+    if os.path.exists(cache_path):
+        try:
+            df = pd.read_parquet(cache_path)
+            os.utime(cache_path)  # Mark as recently used for pruning
+            return {'filename': filename, 'data': df}
+        except (OSError, ValueError):
+            pass  # Unreadable cache entry: regenerate and overwrite it
+    
+    # One numpy Generator per call, seeded from the request so results are reproducible
+    rng = np.random.default_rng(zlib.crc32(f"{integration_id}|{data_type}|{start_iso}|{end_iso}".encode()))
+    
+    # Generate date range
+    date_range = pd.date_range(start=start_iso, end=end_iso, freq='D')
+    date_strs = date_range.strftime("%Y-%m-%d").to_numpy()
+    
+    df = generator(rng, date_range, date_strs)
+    
+    tmp_path = None
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # Write to a uniquely named temporary file first so a concurrent reader never
+        # sees a partial file and concurrent writers don't clobber each other's output
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(cache_path), suffix=".tmp", delete=False) as tmp:
+            tmp_path = tmp.name
+            df.to_parquet(tmp, index=False)
+        os.replace(tmp_path, cache_path)
+        _prune_integration_cache()
+    except OSError:
+        # The disk cache is best-effort; the in-memory result is still returned
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    
+    return {
+        'filename': filename,
+        'data': df
+    }
@@ -1,21 +1,9 @@
 import pandas as pd
 import re
+import functools
 from collections import Counter
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
 import streamlit as st
-
-# Download required NLTK resources if not already present
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+from utils.data_processor import DATAFRAME_HASH_FUNCS, normalize_column_name, looks_like_datetime
 
 # Define keyword mappings for visualization types
 CHART_TYPE_KEYWORDS = {
@@ -38,10 +26,71 @@ AGGREGATION_KEYWORDS = {
     'median': ['median', 'middle']
 }
 
+def _build_keyword_matcher(keywords):
+    """Compile keywords into one regex that reports every keyword occurring in a text
+    
+    A zero-width lookahead tries the alternation at every position, longest keyword
+    first. Keywords hidden inside a longer match at the same position (e.g. "bar" in
+    "bar chart") are recovered through each keyword's precomputed contained keywords.
+    """
+    keywords = sorted(set(keywords), key=len, reverse=True)
+    pattern = re.compile('(?=(' + '|'.join(map(re.escape, keywords)) + '))')
+    contained = {kw: frozenset(other for other in keywords if other in kw) for kw in keywords}
+    return pattern, contained
+
+# Flat keyword -> ((chart type, weight), ...) / aggregation lookups. Keywords listed under
+# several charts (e.g. "distribution") split one point between them, so a chart's own
+# keyword ("histogram") outweighs an ambiguous one
+_viz_types_by_keyword = {}
+for _viz_type, _keywords in CHART_TYPE_KEYWORDS.items():
+    for _keyword in _keywords:
+        _viz_types_by_keyword.setdefault(_keyword, []).append(_viz_type)
+_KW_TO_VIZ = {
+    kw: tuple((viz_type, 1 / len(viz_types)) for viz_type in viz_types)
+    for kw, viz_types in _viz_types_by_keyword.items()
+}
+_VIZ_ORDER = {viz_type: i for i, viz_type in enumerate(CHART_TYPE_KEYWORDS)}
+_KW_TO_AGG = {kw: agg for agg, kws in AGGREGATION_KEYWORDS.items() for kw in kws}
+
+_KEYWORD_RE, _CONTAINED_KEYWORDS = _build_keyword_matcher([*_KW_TO_VIZ, *_KW_TO_AGG])
+
+def match_keywords(query):
+    """Return the set of chart-type and aggregation keywords found in the query in one pass"""
+    found = set()
+    for match in _KEYWORD_RE.finditer(query):
+        found |= _CONTAINED_KEYWORDS[match.group(1)]
+    return found
+
+@st.cache_data(show_spinner=False, hash_funcs=DATAFRAME_HASH_FUNCS)
+def classify_columns(df):
+    """Split columns into (numeric, categorical, temporal) lists in one pass over the dtypes
+    
+    Without real datetime columns, text columns whose sampled values parse as dates
+    count as temporal too.
+    """
+    numeric_cols, categorical_cols, temporal_cols = [], [], []
+    for col, dtype in df.dtypes.items():
+        kind = dtype.kind
+        if kind in 'iuf':
+            numeric_cols.append(col)
+        elif kind == 'M':
+            temporal_cols.append(col)
+        elif kind in 'ObU' or isinstance(dtype, pd.CategoricalDtype):
+            categorical_cols.append(col)
+    
+    if not temporal_cols:
+        temporal_cols = [col for col in categorical_cols if looks_like_datetime(df[col])]
+    
+    return numeric_cols, categorical_cols, temporal_cols
+
+@st.cache_data(show_spinner=False, hash_funcs=DATAFRAME_HASH_FUNCS)
 def process_natural_language_query(query, df):
     """
     Process a natural language query and generate a visualization configuration.
     
+    Results are cached per query and dataset content, so reruns that repeat the
+    same query skip the parsing entirely.
+    
     Args:
         query (str): The natural language query from the user
         df (DataFrame): The pandas DataFrame containing the data
@@ -52,128 +101,126 @@ def process_natural_language_query(query, df):
     # Convert query to lowercase
     query = query.lower()
     
-    # Tokenize and remove stopwords
-    stop_words = set(stopwords.words('english'))
-    word_tokens = word_tokenize(query)
-    filtered_tokens = [w for w in word_tokens if w not in stop_words]
-    
     # Get column names and types from dataframe
-    numeric_cols = df.select_dtypes(include=['int64', 'float64']).columns.tolist()
-    categorical_cols = df.select_dtypes(include=['object', 'category', 'bool']).columns.tolist()
-    temporal_cols = df.select_dtypes(include=['datetime64']).columns.tolist()
+    numeric_cols, categorical_cols, temporal_cols = classify_columns(df)
     
-    # Try to convert string columns to datetime if they're not already detected
-    if not temporal_cols:
-        for col in categorical_cols:
-            try:
-                pd.to_datetime(df[col])
-                temporal_cols.append(col)
-            except:
-                pass
+    # Sets for membership tests; the lists keep the column order for defaults
+    column_sets = {
+        "numeric": set(numeric_cols),
+        "categorical": set(categorical_cols),
+        "temporal": set(temporal_cols)
+    }
+    
+    # Find every known keyword in a single scan of the query
+    keywords = match_keywords(query)
     
     # Identify visualization type based on keywords
-    viz_type = identify_visualization_type(query)
+    viz_type = identify_visualization_type(query, keywords)
     
     # Identify referenced columns
-    referenced_cols = identify_referenced_columns(query, df.columns)
+    columns = tuple(df.columns)
+    referenced_cols = identify_referenced_columns(query, build_column_variations(columns))
     
     # Identify aggregation method
-    aggregation = identify_aggregation(query)
+    aggregation = identify_aggregation(query, keywords)
     
-    # Generate configuration based on visualization type
+    # Generate configuration based on visualization type (the query is already
+    # lowercase, so only its first letter needs changing for the title)
     config = {
         "chart_type": viz_type,
-        "title": query.capitalize()
+        "title": query[:1].upper() + query[1:]
     }
     
     # Try to intelligently assign axes based on column types and visualization type
-    if viz_type == 'bar_chart':
-        config = configure_bar_chart(config, df, referenced_cols, numeric_cols, categorical_cols, temporal_cols, aggregation)
-    
-    elif viz_type == 'line_chart':
-        config = configure_line_chart(config, df, referenced_cols, numeric_cols, categorical_cols, temporal_cols, aggregation)
-    
-    elif viz_type == 'scatter_plot':
-        config = configure_scatter_plot(config, df, referenced_cols, numeric_cols)
-    
-    elif viz_type == 'pie_chart':
-        config = configure_pie_chart(config, df, referenced_cols, numeric_cols, categorical_cols, aggregation)
-    
-    elif viz_type == 'histogram':
-        config = configure_histogram(config, df, referenced_cols, numeric_cols)
-    
-    elif viz_type == 'box_plot':
-        config = configure_box_plot(config, df, referenced_cols, numeric_cols, categorical_cols)
-    
-    elif viz_type == 'heatmap':
-        config = configure_heatmap(config, df, referenced_cols, numeric_cols, categorical_cols)
+    configurer = _CONFIGURERS.get(viz_type)
+    if configurer:
+        configure, extra_args = configurer
+        args = {
+            "categorical_cols": categorical_cols,
+            "temporal_cols": temporal_cols,
+            "aggregation": aggregation
+        }
+        config = configure(config, columns, df.index.name or "index", referenced_cols, column_sets, numeric_cols, *(args[name] for name in extra_args))
     
     return config
 
-def identify_visualization_type(query):
-    """Identify the visualization type from the query"""
-    scores = {viz_type: 0 for viz_type in CHART_TYPE_KEYWORDS}
-    
-    # Calculate scores for each visualization type
-    for viz_type, keywords in CHART_TYPE_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in query:
-                scores[viz_type] += 1
-    
-    # Default to bar chart if no visualization type is specified
-    if max(scores.values()) == 0:
-        if "over time" in query or "trend" in query or "time series" in query:
-            return "line_chart"
-        else:
-            return "bar_chart"
+def identify_visualization_type(query, keywords=None):
+    """Identify the visualization type from the query (keywords: result of match_keywords)"""
+    if keywords is None:
+        keywords = match_keywords(query)
+    # Default to bar chart if no visualization type is specified ("trend" and
+    # "time series" are line_chart keywords, so only "over time" can remain)
+    if keywords.isdisjoint(_KW_TO_VIZ):
+        return "line_chart" if "over time" in query else "bar_chart"
+    
+    # Sum the weights of the matched keywords, inserting in CHART_TYPE_KEYWORDS order
+    # so that ties still go to the chart type listed first
+    hits = [hit for keyword in keywords for hit in _KW_TO_VIZ.get(keyword, ())]
+    scores = Counter()
+    for viz_type, weight in sorted(hits, key=lambda hit: _VIZ_ORDER[hit[0]]):
+        scores[viz_type] += weight
     
     # Return the visualization type with the highest score
-    return max(scores, key=scores.get)
+    return scores.most_common(1)[0][0]
+
+# Words as matched between queries and column names (punctuation is ignored)
+_WORD_RE = re.compile(r"\w+")
+
+def _singular_words(text):
+    """Split a text into words with any trailing 's' stripped, so plurals match singulars"""
+    return [word[:-1] if len(word) > 1 and word.endswith('s') else word for word in _WORD_RE.findall(text)]
 
-def identify_referenced_columns(query, columns):
-    """Identify columns referenced in the query"""
-    referenced_cols = []
+@functools.lru_cache(maxsize=32)
+def build_column_variations(columns):
+    """Map lowercase singular spellings of each column name (as-is and spaced) to (position, column)
     
-    # Normalize column names for matching
+    Cached per schema, so repeated queries against the same dataset reuse the table.
+    """
     column_variations = {}
-    for col in columns:
-        # Original column name
-        column_variations[col.lower()] = col
-        
-        # Without underscores and spaces
-        normalized = col.lower().replace('_', ' ').replace('-', ' ')
-        column_variations[normalized] = col
+    for position, col in enumerate(columns):
+        lowered = col.lower()
+        normalized = normalize_column_name(lowered)
         
-        # Plural variations
-        if normalized.endswith('s'):
-            column_variations[normalized[:-1]] = col
-        else:
-            column_variations[normalized + 's'] = col
-    
-    # Check for column name mentions in the query
-    for variation, original in column_variations.items():
-        if variation in query and original not in referenced_cols:
-            referenced_cols.append(original)
-    
-    return referenced_cols
+        # Original column name and without underscores and dashes; plurals are
+        # covered by matching singular words on both sides
+        for variation in (lowered, normalized):
+            key = ' '.join(_singular_words(variation))
+            if key:
+                column_variations[key] = (position, col)
+    
+    return column_variations
 
-def identify_aggregation(query):
-    """Identify aggregation method from the query"""
-    for agg, keywords in AGGREGATION_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in query:
-                return agg
+def identify_referenced_columns(query, column_variations):
+    """Identify columns referenced in the (already lowercased) query (column_variations: from build_column_variations)"""
+    # Every run of consecutive query words, so matching is set intersection rather than substring scans
+    words = _singular_words(query)
+    phrases = {' '.join(words[i:j]) for i in range(len(words)) for j in range(i + 1, len(words) + 1)}
+    
+    # Report referenced columns in dataset order
+    matches = {column_variations[phrase] for phrase in phrases & column_variations.keys()}
+    return [col for _, col in sorted(matches)]
+
+def identify_aggregation(query, keywords=None):
+    """Identify aggregation method from the query (keywords: result of match_keywords)"""
+    if keywords is None:
+        keywords = match_keywords(query)
+    matched = {_KW_TO_AGG[keyword] for keyword in keywords if keyword in _KW_TO_AGG}
+    
+    # Earlier entries in AGGREGATION_KEYWORDS win when several are mentioned
+    for agg in AGGREGATION_KEYWORDS:
+        if agg in matched:
+            return agg
     
     # Default to sum for aggregation
     return 'sum'
 
-def configure_bar_chart(config, df, referenced_cols, numeric_cols, categorical_cols, temporal_cols, aggregation):
+def configure_bar_chart(config, columns, index_name, referenced_cols, column_sets, numeric_cols, categorical_cols, temporal_cols, aggregation):
     """Configure bar chart visualization"""
     if len(referenced_cols) >= 2:
         # If we have both categorical and numeric columns referenced
-        cat_refs = [col for col in referenced_cols if col in categorical_cols]
-        num_refs = [col for col in referenced_cols if col in numeric_cols]
-        time_refs = [col for col in referenced_cols if col in temporal_cols]
+        cat_refs = [col for col in referenced_cols if col in column_sets["categorical"]]
+        num_refs = [col for col in referenced_cols if col in column_sets["numeric"]]
+        time_refs = [col for col in referenced_cols if col in column_sets["temporal"]]
         
         if cat_refs and num_refs:
             config["x"] = cat_refs[0]
@@ -197,12 +244,12 @@ def configure_bar_chart(config, df, referenced_cols, numeric_cols, categorical_c
             config["x"] = numeric_cols[0]
             config["y"] = numeric_cols[1]
         elif numeric_cols:
-            config["x"] = df.index.name or "index"
+            config["x"] = index_name
             config["y"] = numeric_cols[0]
         else:
             # Fallback for non-numeric data
-            config["x"] = df.columns[0]
-            config["y"] = df.columns[1] if len(df.columns) > 1 else df.columns[0]
+            config["x"] = columns[0]
+            config["y"] = columns[1] if len(columns) > 1 else columns[0]
     
     # Add color if we have multiple categories
     if len(categorical_cols) > 1 and categorical_cols[0] != config["x"]:
@@ -213,25 +260,25 @@ def configure_bar_chart(config, df, referenced_cols, numeric_cols, categorical_c
     
     return config
 
-def configure_line_chart(config, df, referenced_cols, numeric_cols, categorical_cols, temporal_cols, aggregation):
+def configure_line_chart(config, columns, index_name, referenced_cols, column_sets, numeric_cols, categorical_cols, temporal_cols, aggregation):
     """Configure line chart visualization"""
     # For line charts, prioritize time columns for x-axis
     if temporal_cols:
         config["x"] = temporal_cols[0]
         
         # For y-axis, use referenced numeric column or first numeric column
-        num_refs = [col for col in referenced_cols if col in numeric_cols]
+        num_refs = [col for col in referenced_cols if col in column_sets["numeric"]]
         if num_refs:
             config["y"] = num_refs[0]
         elif numeric_cols:
             config["y"] = numeric_cols[0]
         else:
             # Fallback if no numeric columns
-            config["y"] = referenced_cols[0] if referenced_cols else df.columns[0]
+            config["y"] = referenced_cols[0] if referenced_cols else columns[0]
     else:
         # No time columns, try to use numeric columns for x and y
         if len(numeric_cols) >= 2:
-            num_refs = [col for col in referenced_cols if col in numeric_cols]
+            num_refs = [col for col in referenced_cols if col in column_sets["numeric"]]
             if len(num_refs) >= 2:
                 config["x"] = num_refs[0]
                 config["y"] = num_refs[1]
@@ -239,16 +286,16 @@ def configure_line_chart(config, df, referenced_cols, numeric_cols, categorical_
                 config["x"] = numeric_cols[0]
                 config["y"] = numeric_cols[1]
         elif numeric_cols:
-            config["x"] = df.index.name or "index"
+            config["x"] = index_name
             config["y"] = numeric_cols[0]
         else:
             # Fallback for non-numeric data
-            config["x"] = df.columns[0]
-            config["y"] = df.columns[1] if len(df.columns) > 1 else df.columns[0]
+            config["x"] = columns[0]
+            config["y"] = columns[1] if len(columns) > 1 else columns[0]
     
     # Add color grouping if categorical columns exist
     if categorical_cols:
-        cat_refs = [col for col in referenced_cols if col in categorical_cols]
+        cat_refs = [col for col in referenced_cols if col in column_sets["categorical"]]
         if cat_refs:
             config["color"] = cat_refs[0]
         else:
@@ -259,11 +306,11 @@ def configure_line_chart(config, df, referenced_cols, numeric_cols, categorical_
     
     return config
 
-def configure_scatter_plot(config, df, referenced_cols, numeric_cols):
+def configure_scatter_plot(config, columns, index_name, referenced_cols, column_sets, numeric_cols):
     """Configure scatter plot visualization"""
     # Scatter plots need at least two numeric columns
     if len(numeric_cols) >= 2:
-        num_refs = [col for col in referenced_cols if col in numeric_cols]
+        num_refs = [col for col in referenced_cols if col in column_sets["numeric"]]
         if len(num_refs) >= 2:
             config["x"] = num_refs[0]
             config["y"] = num_refs[1]
@@ -279,17 +326,17 @@ def configure_scatter_plot(config, df, referenced_cols, numeric_cols):
     else:
         # Not enough numeric columns for a scatter plot, default to something sensible
         config["chart_type"] = "bar_chart"
-        config["x"] = df.columns[0]
-        config["y"] = numeric_cols[0] if numeric_cols else df.columns[1] if len(df.columns) > 1 else df.columns[0]
+        config["x"] = columns[0]
+        config["y"] = numeric_cols[0] if numeric_cols else columns[1] if len(columns) > 1 else columns[0]
     
     return config
 
-def configure_pie_chart(config, df, referenced_cols, numeric_cols, categorical_cols, aggregation):
+def configure_pie_chart(config, columns, index_name, referenced_cols, column_sets, numeric_cols, categorical_cols, aggregation):
     """Configure pie chart visualization"""
     # Pie charts need categorical labels and numeric values
     if categorical_cols and numeric_cols:
-        cat_refs = [col for col in referenced_cols if col in categorical_cols]
-        num_refs = [col for col in referenced_cols if col in numeric_cols]
+        cat_refs = [col for col in referenced_cols if col in column_sets["categorical"]]
+        num_refs = [col for col in referenced_cols if col in column_sets["numeric"]]
         
         if cat_refs and num_refs:
             config["names"] = cat_refs[0]
@@ -303,16 +350,16 @@ def configure_pie_chart(config, df, referenced_cols, numeric_cols, categorical_c
     else:
         # Not enough of the right column types, default to something else
         config["chart_type"] = "bar_chart"
-        config["x"] = df.columns[0]
-        config["y"] = numeric_cols[0] if numeric_cols else df.columns[1] if len(df.columns) > 1 else df.columns[0]
+        config["x"] = columns[0]
+        config["y"] = numeric_cols[0] if numeric_cols else columns[1] if len(columns) > 1 else columns[0]
     
     return config
 
-def configure_histogram(config, df, referenced_cols, numeric_cols):
+def configure_histogram(config, columns, index_name, referenced_cols, column_sets, numeric_cols):
     """Configure histogram visualization"""
     # Histograms need numeric data
     if numeric_cols:
-        num_refs = [col for col in referenced_cols if col in numeric_cols]
+        num_refs = [col for col in referenced_cols if col in column_sets["numeric"]]
         if num_refs:
             config["x"] = num_refs[0]
         else:
@@ -323,17 +370,17 @@ def configure_histogram(config, df, referenced_cols, numeric_cols):
     else:
         # No numeric columns, default to bar chart
         config["chart_type"] = "bar_chart"
-        config["x"] = df.columns[0]
-        config["y"] = df.columns[1] if len(df.columns) > 1 else df.columns[0]
+        config["x"] = columns[0]
+        config["y"] = columns[1] if len(columns) > 1 else columns[0]
     
     return config
 
-def configure_box_plot(config, df, referenced_cols, numeric_cols, categorical_cols):
+def configure_box_plot(config, columns, index_name, referenced_cols, column_sets, numeric_cols, categorical_cols):
     """Configure box plot visualization"""
     # Box plots need numeric values and optionally categories for grouping
     if numeric_cols:
-        num_refs = [col for col in referenced_cols if col in numeric_cols]
-        cat_refs = [col for col in referenced_cols if col in categorical_cols]
+        num_refs = [col for col in referenced_cols if col in column_sets["numeric"]]
+        cat_refs = [col for col in referenced_cols if col in column_sets["categorical"]]
         
         if num_refs:
             config["y"] = num_refs[0]
@@ -350,17 +397,17 @@ def configure_box_plot(config, df, referenced_cols, numeric_cols, categorical_co
     else:
         # No numeric columns, default to bar chart
         config["chart_type"] = "bar_chart"
-        config["x"] = df.columns[0]
-        config["y"] = df.columns[1] if len(df.columns) > 1 else df.columns[0]
+        config["x"] = columns[0]
+        config["y"] = columns[1] if len(columns) > 1 else columns[0]
     
     return config
 
-def configure_heatmap(config, df, referenced_cols, numeric_cols, categorical_cols):
+def configure_heatmap(config, columns, index_name, referenced_cols, column_sets, numeric_cols, categorical_cols):
     """Configure heatmap visualization"""
     # Heatmaps need two categorical dimensions and one numeric value
     if len(categorical_cols) >= 2 and numeric_cols:
-        cat_refs = [col for col in referenced_cols if col in categorical_cols]
-        num_refs = [col for col in referenced_cols if col in numeric_cols]
+        cat_refs = [col for col in referenced_cols if col in column_sets["categorical"]]
+        num_refs = [col for col in referenced_cols if col in column_sets["numeric"]]
         
         if len(cat_refs) >= 2 and num_refs:
             config["x"] = cat_refs[0]
@@ -384,7 +431,18 @@ def configure_heatmap(config, df, referenced_cols, numeric_cols, categorical_col
     else:
         # Not enough of the right column types, default to something else
         config["chart_type"] = "bar_chart"
-        config["x"] = categorical_cols[0] if categorical_cols else df.columns[0]
-        config["y"] = numeric_cols[0] if numeric_cols else df.columns[1] if len(df.columns) > 1 else df.columns[0]
+        config["x"] = categorical_cols[0] if categorical_cols else columns[0]
+        config["y"] = numeric_cols[0] if numeric_cols else columns[1] if len(columns) > 1 else columns[0]
     
     return config
+
+# Visualization type -> (configure function, arguments it takes after numeric_cols)
+_CONFIGURERS = {
+    'bar_chart': (configure_bar_chart, ("categorical_cols", "temporal_cols", "aggregation")),
+    'line_chart': (configure_line_chart, ("categorical_cols", "temporal_cols", "aggregation")),
+    'scatter_plot': (configure_scatter_plot, ()),
+    'pie_chart': (configure_pie_chart, ("categorical_cols", "aggregation")),
+    'histogram': (configure_histogram, ()),
+    'box_plot': (configure_box_plot, ("categorical_cols",)),
+    'heatmap': (configure_heatmap, ("categorical_cols",))
+}
@@ -0,0 +1,136 @@
+import pandas as pd
+import numpy as np
+import streamlit as st
+
+# Built-in sample datasets and their descriptions
+SAMPLE_DATASETS = {
+    "Retail Sales": "Retail transactions with customer demographics and product categories",
+    "Inventory Management": "Stock levels, reorder points, and inventory turnover data",
+    "Financial Performance": "Revenue, expenses, and profit metrics over time",
+    "Marketing Campaign": "Campaign performance metrics including ROI and conversion rates",
+    "Customer Feedback": "Customer satisfaction scores and feedback categories"
+}
+
+# Price multipliers used to spread sale and cost amounts over several magnitudes
+PRICE_SCALES = np.array([0.1, 1, 10])
+
+def categorical_column(rng, levels, n, p=None):
+    """Draw n values from levels as a dictionary-encoded categorical column"""
+    return pd.Categorical(rng.choice(levels, n, p=p), categories=levels)
+
+def categorical_columns(rng, levels, n):
+    """Draw several uniform categorical columns in one call; levels maps column -> categories"""
+    codes = rng.integers(0, [len(categories) for categories in levels.values()], size=(n, len(levels)))
+    return {
+        col: pd.Categorical.from_codes(codes[:, i], categories=categories)
+        for i, (col, categories) in enumerate(levels.items())
+    }
+
+def integer_columns(rng, ranges, n):
+    """Draw several uniform integer columns in one call; ranges maps column -> (low, high[, step])"""
+    low, high, step = (np.array(bound) for bound in zip(*(r if len(r) == 3 else (*r, 1) for r in ranges.values())))
+    counts = -(-(high - low) // step)
+    values = low + step * rng.integers(0, counts, size=(n, len(ranges)))
+    return {col: values[:, i] for i, col in enumerate(ranges)}
+
+@st.cache_data(show_spinner=False)
+def load_sample_dataset(name):
+    """Generate one of the SAMPLE_DATASETS (seeded, so it is built once and cached)"""
+    rng = np.random.default_rng(42)
+
+    if name == "Retail Sales":
+        # Create realistic retail sales data
+        n = 100
+        data = {
+            "Date": pd.date_range(start="2023-01-01", periods=n),
+            **categorical_columns(rng, {
+                "Product_Category": ["Electronics", "Clothing", "Home Goods", "Groceries", "Beauty"]
+            }, n),
+            "Customer_Gender": categorical_column(rng, ["Male", "Female", "Non-Binary"], n, p=[0.48, 0.48, 0.04]),
+            **integer_columns(rng, {
+                "Customer_Age": (18, 75),
+                "Sale_Amount": (10, 500),
+                "Items_Purchased": (1, 10)
+            }, n)
+        }
+        data["Sale_Amount"] = (data["Sale_Amount"] * rng.choice(PRICE_SCALES, n)).round(2)
+        df = pd.DataFrame(data, columns=["Date", "Product_Category", "Customer_Age", "Customer_Gender", "Sale_Amount", "Items_Purchased"])
+
+    elif name == "Inventory Management":
+        n = 100
+        data = {
+            "Product_ID": [f"PROD{i:04d}" for i in range(1, n + 1)],
+            "Product_Name": [f"Product {i}" for i in range(1, n + 1)],
+            **categorical_columns(rng, {
+                "Category": ["Electronics", "Clothing", "Home Goods", "Office", "Food"]
+            }, n),
+            **integer_columns(rng, {
+                "Stock_Level": (0, 500),
+                "Reorder_Point": (5, 100),
+                "Lead_Time_Days": (1, 30),
+                "Cost_Per_Unit": (5, 200)
+            }, n)
+        }
+        data["Cost_Per_Unit"] = (data["Cost_Per_Unit"] * rng.choice(PRICE_SCALES, n)).round(2)
+        df = pd.DataFrame(data)
+
+    elif name == "Financial Performance":
+        n = 36
+        data = {
+            "Month": pd.date_range(start="2020-01-01", periods=n, freq="M"),
+            **integer_columns(rng, {
+                "Revenue": (10000, 50000),
+                "Cost_of_Goods": (5000, 25000),
+                "Operating_Expenses": (2000, 10000),
+                "Marketing_Spend": (1000, 5000)
+            }, n),
+            **categorical_columns(rng, {
+                "Department": ["Sales", "Marketing", "Operations", "IT"]
+            }, n)
+        }
+        # Add an upward trend to revenue and cost of goods
+        data["Revenue"] = data["Revenue"] + np.arange(n) * 500
+        data["Cost_of_Goods"] = data["Cost_of_Goods"] + np.arange(n) * 200
+        df = pd.DataFrame(data)
+        df["Profit"] = df["Revenue"] - df["Cost_of_Goods"] - df["Operating_Expenses"] - df["Marketing_Spend"]
+
+    elif name == "Marketing Campaign":
+        n = 50
+        data = {
+            "Campaign_ID": [f"CAMP{i:03d}" for i in range(1, n + 1)],
+            **categorical_columns(rng, {
+                "Campaign_Type": ["Email", "Social Media", "Search", "Display", "Content"]
+            }, n),
+            "Start_Date": pd.date_range(start="2022-01-01", periods=n, freq="W"),
+            **integer_columns(rng, {
+                "Budget": (1000, 10000, 500),
+                "Impressions": (1000, 100000, 1000),
+                "Clicks": (50, 5000, 50),
+                "Conversions": (1, 500, 10)
+            }, n)
+        }
+        df = pd.DataFrame(data)
+        df["CTR"] = (df["Clicks"] / df["Impressions"] * 100).round(2)
+        df["Conversion_Rate"] = (df["Conversions"] / df["Clicks"] * 100).round(2)
+        df["Cost_Per_Conversion"] = (df["Budget"] / df["Conversions"]).round(2)
+
+    elif name == "Customer Feedback":
+        n = 200
+        data = {
+            "Date": pd.date_range(start="2023-01-01", periods=n),
+            "Customer_ID": [f"CUST{i:04d}" for i in range(1, n + 1)],
+            **categorical_columns(rng, {
+                "Product_Purchased": ["Product A", "Product B", "Product C", "Product D"],
+                "Feedback_Category": ["Quality", "Price", "Service", "Usability", "Delivery"]
+            }, n),
+            **integer_columns(rng, {
+                "Satisfaction_Score": (1, 6),
+                "Recommendation_Likely": (1, 11)
+            }, n)
+        }
+        df = pd.DataFrame(data, columns=["Date", "Customer_ID", "Product_Purchased", "Satisfaction_Score", "Feedback_Category", "Recommendation_Likely"])
+
+    else:
+        raise ValueError(f"Unknown sample dataset: {name}")
+
+    return df
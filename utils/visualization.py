@@ -1,8 +1,19 @@
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
+# plotly.express is slow to import, so each chart creator imports it on first use
 import numpy as np
-from utils.data_processor import get_column_types, detect_time_series
+import streamlit as st
+from utils.data_processor import get_column_types, detect_time_series, looks_like_datetime, DATAFRAME_HASH_FUNCS
+
+# Line charts with more points than this (per series) are decimated before plotting
+LINE_POINT_BUDGET = 4000
+
+# Scatter plots with more rows than this are randomly subsampled before plotting
+SCATTER_POINT_BUDGET = 50_000
+
+def _optional_column(value):
+    """Column name from an optional config field, or None for the 'None' option the pages offer"""
+    return None if value in (None, 'None', '') else value
 
 def create_visualization(df, config):
     """
@@ -15,26 +26,9 @@ def create_visualization(df, config):
     Returns:
         fig: A plotly figure object
     """
-    chart_type = config.get('chart_type', 'bar_chart')
-    
-    # Dispatch to the appropriate visualization function
-    if chart_type == 'bar_chart':
-        return create_bar_chart(df, config)
-    elif chart_type == 'line_chart':
-        return create_line_chart(df, config)
-    elif chart_type == 'scatter_plot':
-        return create_scatter_plot(df, config)
-    elif chart_type == 'pie_chart':
-        return create_pie_chart(df, config)
-    elif chart_type == 'histogram':
-        return create_histogram(df, config)
-    elif chart_type == 'box_plot':
-        return create_box_plot(df, config)
-    elif chart_type == 'heatmap':
-        return create_heatmap(df, config)
-    else:
-        # Default to bar chart
-        return create_bar_chart(df, config)
+    # Dispatch to the appropriate visualization function, defaulting to a bar chart
+    create = _CHART_CREATORS.get(config.get('chart_type', 'bar_chart'), create_bar_chart)
+    return create(df, config)
 
 def render_visualization(df, config):
     """Wrapper around create_visualization to handle errors gracefully"""
@@ -52,14 +46,41 @@ def render_visualization(df, config):
         )
         return fig
 
+@st.cache_data(show_spinner=False, max_entries=256, hash_funcs=DATAFRAME_HASH_FUNCS)
+def cached_render_visualization(df, config):
+    """render_visualization memoized on the dataframe fingerprint and config"""
+    return render_visualization(df, config)
+
+def sum_bar_data(df, x, y, color=None):
+    """Sum y per bar (x, and color when set) in first-appearance order; other frames are returned as is
+    
+    Positive and negative rows are summed separately, so bars that mix them still stack
+    up and down as before, and missing x or color values keep their own bars.
+    """
+    # Coloring by the x column itself is allowed, so each column is a key at most once
+    keys = list(dict.fromkeys(key for key in (x, color) if key is not None))
+    if y in keys or not all(col in df.columns for col in keys + [y]) or not pd.api.types.is_numeric_dtype(df[y]):
+        return df
+    
+    negative = (df[y] < 0).to_numpy()
+    grouped = df.groupby(keys + [negative], observed=True, sort=False, dropna=False)[y]
+    if grouped.ngroups == len(df):
+        return df
+    return grouped.sum(min_count=1).droplevel(-1).reset_index()
+
 def create_bar_chart(df, config):
     """Create a bar chart"""
+    import plotly.express as px
+    
     x = config.get('x')
     y = config.get('y')
-    color = config.get('color', None)
+    color = _optional_column(config.get('color'))
     orientation = config.get('orientation', 'Vertical')
     title = config.get('title', f'Bar Chart of {y} by {x}')
     
+    # Plotly stacks one segment per row sharing a bar, so send one summed row per bar instead
+    df = sum_bar_data(df, x, y, color)
+    
     # Handle orientation
     if orientation == 'Horizontal':
         # Swap x and y for horizontal orientation
@@ -67,7 +88,7 @@ def create_bar_chart(df, config):
             df, 
             y=x, 
             x=y, 
-            color=color if color != 'None' else None,
+            color=color,
             title=title,
             orientation='h'
         )
@@ -76,7 +97,7 @@ def create_bar_chart(df, config):
             df, 
             x=x, 
             y=y, 
-            color=color if color != 'None' else None,
+            color=color,
             title=title
         )
     
@@ -84,24 +105,63 @@ def create_bar_chart(df, config):
     fig.update_layout(
         xaxis_title=x,
         yaxis_title=y,
-        legend_title=color if color and color != 'None' else None
+        legend_title=color
     )
     
     return fig
 
+def _min_max_positions(values, budget):
+    """Positions of each bucket's minimum and maximum, so peaks survive decimation to ~budget points"""
+    n = len(values)
+    size = -(-2 * n // budget)
+    n_buckets = -(-n // size)
+    padded = np.full(n_buckets * size, np.nan)
+    padded[:n] = values
+    buckets = padded.reshape(n_buckets, size)
+    
+    # NaNs (padding and missing values) never win the min or max of their bucket
+    missing = np.isnan(buckets)
+    lows = np.where(missing, np.inf, buckets).argmin(axis=1)
+    highs = np.where(missing, -np.inf, buckets).argmax(axis=1)
+    starts = np.arange(n_buckets) * size
+    positions = np.union1d(starts + lows, starts + highs)
+    return np.union1d(positions[positions < n], [0, n - 1])
+
+def downsample_line_data(df, y, color=None, budget=LINE_POINT_BUDGET):
+    """Min/max-decimate each line of a line chart to about budget points, keeping row order"""
+    if len(df) <= budget or not pd.api.types.is_numeric_dtype(df[y]):
+        return df
+    
+    values = df[y].to_numpy(dtype=float, na_value=np.nan)
+    if color is None:
+        groups = [np.arange(len(df))]
+    else:
+        groups = df.groupby(color, sort=False, observed=True, dropna=False).indices.values()
+    
+    keep = [
+        group if len(group) <= budget else group[_min_max_positions(values[group], budget)]
+        for group in groups
+    ]
+    return df.iloc[np.sort(np.concatenate(keep))]
+
 def create_line_chart(df, config):
     """Create a line chart"""
+    import plotly.express as px
+    
     x = config.get('x')
     y = config.get('y')
-    color = config.get('color', None)
+    color = _optional_column(config.get('color'))
     markers = config.get('markers', False)
     title = config.get('title', f'Line Chart of {y} over {x}')
     
+    # Browsers choke on serializing and drawing huge traces; thin them server-side
+    df = downsample_line_data(df, y, color)
+    
     fig = px.line(
         df, 
         x=x, 
         y=y, 
-        color=color if color != 'None' else None,
+        color=color,
         title=title,
         markers=markers
     )
@@ -110,25 +170,51 @@ def create_line_chart(df, config):
     fig.update_layout(
         xaxis_title=x,
         yaxis_title=y,
-        legend_title=color if color and color != 'None' else None
+        legend_title=color
     )
     
     return fig
 
+def sample_scatter_data(df, color=None, budget=SCATTER_POINT_BUDGET):
+    """Randomly sample a scatter plot down to about budget rows, keeping row order
+    
+    With a color column each group is sampled in proportion to its size (at least one
+    row each), so the plot keeps the groups' mix. The seed is fixed so reruns match.
+    """
+    if len(df) <= budget:
+        return df
+    
+    rng = np.random.default_rng(0)
+    if color is None:
+        groups = [np.arange(len(df))]
+    else:
+        groups = df.groupby(color, sort=False, observed=True, dropna=False).indices.values()
+    
+    keep = [
+        rng.choice(group, size=-(-budget * len(group) // len(df)), replace=False)
+        for group in groups
+    ]
+    return df.iloc[np.sort(np.concatenate(keep))]
+
 def create_scatter_plot(df, config):
     """Create a scatter plot"""
+    import plotly.express as px
+    
     x = config.get('x')
     y = config.get('y')
-    color = config.get('color', None)
-    size = config.get('size', None)
+    color = _optional_column(config.get('color'))
+    size = _optional_column(config.get('size'))
     title = config.get('title', f'Scatter Plot of {y} vs {x}')
     
+    # Past a few tens of thousands of points extra markers only overplot, but still cost the browser
+    df = sample_scatter_data(df, color)
+    
     fig = px.scatter(
         df, 
         x=x, 
         y=y,
-        color=color if color != 'None' else None,
-        size=size if size != 'None' else None,
+        color=color,
+        size=size,
         title=title
     )
     
@@ -136,20 +222,22 @@ def create_scatter_plot(df, config):
     fig.update_layout(
         xaxis_title=x,
         yaxis_title=y,
-        legend_title=color if color and color != 'None' else None
+        legend_title=color
     )
     
     return fig
 
 def create_pie_chart(df, config):
     """Create a pie chart"""
+    import plotly.express as px
+    
     names = config.get('names')
     values = config.get('values')
     hole = config.get('hole', 0)  # 0 for pie chart, > 0 for donut chart
     title = config.get('title', f'Distribution of {values} by {names}')
     
-    # Group by category and sum values
-    pie_data = df.groupby(names)[values].sum().reset_index()
+    # Group by category and sum values (px.pie orders slices itself, so skip sorting groups)
+    pie_data = df.groupby(names, observed=True, sort=False)[values].sum().reset_index()
     
     fig = px.pie(
         pie_data, 
@@ -164,20 +252,60 @@ def create_pie_chart(df, config):
     
     return fig
 
+def binned_histogram(df, x, bins, color=None, title=None):
+    """Histogram with the counts computed by np.histogram, sending only one bar per bin (and color)
+    
+    Returns None when x isn't a plain numeric column with finite values.
+    """
+    if x not in df.columns or not pd.api.types.is_numeric_dtype(df[x]) or pd.api.types.is_bool_dtype(df[x]):
+        return None
+    values = df[x].to_numpy(dtype=float, na_value=np.nan)
+    finite = np.isfinite(values)
+    if not finite.any():
+        return None
+    
+    # Every color group is counted over the same edges so their bars stack per bin
+    edges = np.histogram_bin_edges(values[finite], bins=bins)
+    bin_ranges = np.column_stack([edges[:-1], edges[1:]])
+    if color is None:
+        groups = [(None, finite)]
+    else:
+        groups = [
+            (name, finite & (df[color] == name).to_numpy())
+            for name in df[color].dropna().unique()
+        ]
+    
+    fig = go.Figure(layout=dict(title=title, barmode='stack', legend_title=color))
+    for name, mask in groups:
+        counts, _ = np.histogram(values[mask], bins=edges)
+        fig.add_trace(go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=counts,
+            name=None if name is None else str(name),
+            showlegend=name is not None,
+            customdata=bin_ranges,
+            hovertemplate=f"{x}=%{{customdata[0]:.4~g}} - %{{customdata[1]:.4~g}}<br>Count=%{{y}}<extra></extra>"
+        ))
+    return fig
+
 def create_histogram(df, config):
     """Create a histogram"""
     x = config.get('x')
     bins = config.get('bins', 20)
-    color = config.get('color', None)
+    color = _optional_column(config.get('color'))
     title = config.get('title', f'Histogram of {x}')
     
-    fig = px.histogram(
-        df, 
-        x=x,
-        color=color if color != 'None' else None,
-        nbins=bins,
-        title=title
-    )
+    # Bin numeric columns here so the browser gets one bar per bin instead of every raw value
+    fig = binned_histogram(df, x, bins, color, title)
+    if fig is None:
+        import plotly.express as px
+        fig = px.histogram(
+            df, 
+            x=x,
+            color=color,
+            nbins=bins,
+            title=title
+        )
     
     # Update layout
     fig.update_layout(
@@ -190,27 +318,58 @@ def create_histogram(df, config):
 
 def create_box_plot(df, config):
     """Create a box plot"""
+    import plotly.express as px
+    
     y = config.get('y')
-    x = config.get('x', None)
-    title = config.get('title', f'Box Plot of {y}' + (f' by {x}' if x and x != 'None' else ''))
+    x = _optional_column(config.get('x'))
+    title = config.get('title', f'Box Plot of {y}' + (f' by {x}' if x else ''))
     
     fig = px.box(
         df, 
         y=y,
-        x=x if x != 'None' else None,
+        x=x,
         title=title
     )
     
     # Update layout
     fig.update_layout(
-        xaxis_title=x if x and x != 'None' else None,
+        xaxis_title=x,
         yaxis_title=y
     )
     
     return fig
 
+def pivot_mean(df, index, columns, values):
+    """Mean of a numeric column per (index, columns) pair, like pivot_table(aggfunc='mean')
+    
+    Both keys are factorized to integer codes and the cell sums and counts are taken
+    with np.bincount over the flattened cell number, skipping pandas' groupby machinery.
+    """
+    row_codes, row_levels = pd.factorize(df[index], sort=True)
+    col_codes, col_levels = pd.factorize(df[columns], sort=True)
+    data = df[values].to_numpy(dtype=float, na_value=np.nan)
+    
+    # Rows with a missing key or value don't contribute, as in pivot_table
+    valid = (row_codes >= 0) & (col_codes >= 0) & ~np.isnan(data)
+    cells = row_codes[valid] * len(col_levels) + col_codes[valid]
+    n_cells = len(row_levels) * len(col_levels)
+    sums = np.bincount(cells, weights=data[valid], minlength=n_cells)
+    counts = np.bincount(cells, minlength=n_cells)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = (sums / counts).reshape(len(row_levels), len(col_levels))
+    
+    table = pd.DataFrame(
+        means,
+        index=pd.Index(row_levels, name=index),
+        columns=pd.Index(col_levels, name=columns)
+    )
+    # pivot_table drops rows and columns that have no values at all
+    return table.dropna(how='all').dropna(axis=1, how='all')
+
 def create_heatmap(df, config):
     """Create a heatmap"""
+    import plotly.express as px
+    
     x = config.get('x')
     y = config.get('y')
     values = config.get('values')
@@ -218,20 +377,27 @@ def create_heatmap(df, config):
     title = config.get('title', f'Heatmap of {values} by {x} and {y}')
     
     # Pivot data for heatmap
-    pivot_data = df.pivot_table(
-        index=y, 
-        columns=x, 
-        values=values, 
-        aggfunc='mean'
-    ).fillna(0)
-    
+    if pd.api.types.is_numeric_dtype(df[values]):
+        pivot_data = pivot_mean(df, index=y, columns=x, values=values).fillna(0)
+    else:
+        pivot_data = df.pivot_table(
+            index=y, 
+            columns=x, 
+            values=values, 
+            aggfunc='mean',
+            observed=True
+        ).fillna(0)
+    
+    # Cell values are drawn by the heatmap trace itself (rounded to 2 decimals,
+    # trailing zeros trimmed); Plotly picks a contrasting text color per cell
     fig = px.imshow(
         pivot_data,
         labels=dict(x=x, y=y, color=values),
         x=pivot_data.columns,
         y=pivot_data.index,
         color_continuous_scale=color_scale,
-        title=title
+        title=title,
+        text_auto='.2~f'
     )
     
     # Update layout
@@ -240,21 +406,20 @@ def create_heatmap(df, config):
         yaxis_title=y
     )
     
-    # Add text annotations with values
-    for i, row in enumerate(pivot_data.index):
-        for j, col in enumerate(pivot_data.columns):
-            value = pivot_data.iloc[i, j]
-            text_color = "white" if value > (pivot_data.max().max() / 2) else "black"
-            fig.add_annotation(
-                x=col,
-                y=row,
-                text=str(round(value, 2)),
-                showarrow=False,
-                font=dict(color=text_color)
-            )
-    
     return fig
 
+# Chart type -> function creating its figure
+_CHART_CREATORS = {
+    'bar_chart': create_bar_chart,
+    'line_chart': create_line_chart,
+    'scatter_plot': create_scatter_plot,
+    'pie_chart': create_pie_chart,
+    'histogram': create_histogram,
+    'box_plot': create_box_plot,
+    'heatmap': create_heatmap
+}
+
+@st.cache_data(show_spinner=False, hash_funcs=DATAFRAME_HASH_FUNCS)
 def get_visualization_suggestions(df):
     """
     Generate smart visualization suggestions based on the dataset structure
@@ -268,20 +433,22 @@ def get_visualization_suggestions(df):
     suggestions = []
     column_types = get_column_types(df)
     
-    # Get lists of different column types
-    numeric_cols = [col for col, type in column_types.items() if type == 'numeric']
-    categorical_cols = [col for col, type in column_types.items() if type == 'categorical']
-    datetime_cols = [col for col, type in column_types.items() if type == 'datetime']
+    # Get lists of different column types in one pass over the column types
+    numeric_cols, categorical_cols, datetime_cols = [], [], []
+    columns_by_type = {'numeric': numeric_cols, 'categorical': categorical_cols, 'datetime': datetime_cols}
+    for col, col_type in column_types.items():
+        bucket = columns_by_type.get(col_type)
+        if bucket is not None:
+            bucket.append(col)
     
-    # Try to detect date/time columns if none were found
+    # Try to detect date/time columns if none were found (a sampled parse, not the whole column)
     if not datetime_cols:
         for col in df.columns:
-            if col not in numeric_cols and col not in categorical_cols:
-                try:
-                    pd.to_datetime(df[col])
-                    datetime_cols.append(col)
-                except:
-                    pass
+            if column_types.get(col) not in ('numeric', 'categorical') and looks_like_datetime(df[col]):
+                datetime_cols.append(col)
+    
+    # Distinct counts for the columns the suggestions below size themselves by, in one batched pass
+    unique_counts = df[list(dict.fromkeys(categorical_cols[:2] + numeric_cols[:1]))].nunique().to_dict()
     
     # Suggestion 1: If time series data is available, suggest a line chart
     if datetime_cols and numeric_cols:
@@ -333,14 +500,14 @@ def get_visualization_suggestions(df):
             'config': {
                 'chart_type': 'histogram',
                 'x': numeric_cols[0],
-                'bins': min(30, max(10, df[numeric_cols[0]].nunique() // 2)),
+                'bins': min(30, max(10, unique_counts[numeric_cols[0]] // 2)),
                 'color': categorical_cols[0] if categorical_cols else None,
                 'title': f'Distribution of {numeric_cols[0]}'
             }
         })
     
     # Suggestion 5: If categorical column with few unique values and numeric column, suggest pie chart
-    if categorical_cols and numeric_cols and df[categorical_cols[0]].nunique() <= 8:
+    if categorical_cols and numeric_cols and unique_counts[categorical_cols[0]] <= 8:
         suggestions.append({
             'title': 'Proportion Analysis',
             'description': f'See the relative proportions of {numeric_cols[0]} by {categorical_cols[0]}',
@@ -369,7 +536,7 @@ def get_visualization_suggestions(df):
     # Suggestion 7: Heatmap for relationships between two categorical variables and a numeric value
     if len(categorical_cols) >= 2 and numeric_cols:
         # Only suggest if the combination of categories isn't too large
-        if df[categorical_cols[0]].nunique() * df[categorical_cols[1]].nunique() <= 100:
+        if unique_counts[categorical_cols[0]] * unique_counts[categorical_cols[1]] <= 100:
             suggestions.append({
                 'title': 'Cross-Category Analysis',
                 'description': f'Analyze how {numeric_cols[0]} varies across combinations of {categorical_cols[0]} and {categorical_cols[1]}',